@@ -19,7 +19,7 @@ from datetime import datetime
 from config.conflict_rules import CONFLICT_RULES, ConflictRule, get_rules_for_disciplines
 from analysis.cross_reference import CrossReferenceMap, BrokenReference
 from classification.entity_extractor import SheetEntities
-from knowledge.csi_rules import get_all_checks_for_project
+from knowledge.csi_rules import get_all_checks_for_project, scan_checks
 from utils.logger import get_logger
 
 log = get_logger(__name__)
@@ -192,10 +192,10 @@ def detect_conflicts(
     div_checks = get_all_checks_for_project(disc_codes)
     for disc_code, checks in div_checks.items():
         disc_sheets = [entity_map[s] for s in xref.disciplines_present.get(disc_code, []) if s in entity_map]
+        satisfied = _run_division_checks(disc_code, disc_sheets)
         for check_id, check_desc, check_sev, keywords in checks:
             result.division_checks_run += 1
-            found = _run_division_check(disc_sheets, keywords)
-            if not found:
+            if check_id not in satisfied:
                 conflict_counter += 1
                 result.division_issues_found += 1
                 result.conflicts.append(Conflict(
@@ -390,23 +390,22 @@ def _check_code_rule(
     return conflicts
 
 
-def _run_division_check(
-    disc_sheets: list[SheetEntities], keywords: list[str],
-) -> bool:
-    """Check if any of the discipline's sheets contain the required keywords."""
+def _run_division_checks(
+    disc_code: str, disc_sheets: list[SheetEntities],
+) -> set[str]:
+    """Return the discipline's check IDs whose keywords appear on any of its sheets."""
+    satisfied: set[str] = set()
     for ent in disc_sheets:
         all_text = ent.parsed.to_dict().get("notes", [])
-        text_combined = " ".join(str(t) for t in all_text).upper()
+        text_combined = " ".join(str(t) for t in all_text)
 
         # Also check spec refs, equipment, and dimensions
-        text_combined += " " + " ".join(r.value for r in ent.parsed.spec_refs).upper()
-        text_combined += " " + " ".join(t.value for t in ent.parsed.equipment_tags).upper()
-        text_combined += " " + " ".join(d.raw for d in ent.dimensions).upper()
-
-        for kw in keywords:
-            if kw in text_combined:
-                return True
-    return False
+        text_combined += " " + " ".join(r.value for r in ent.parsed.spec_refs)
+        text_combined += " " + " ".join(t.value for t in ent.parsed.equipment_tags)
+        text_combined += " " + " ".join(d.raw for d in ent.dimensions)
+
+        satisfied.update(cid for disc, cid in scan_checks(text_combined) if disc == disc_code)
+    return satisfied
 
 
 def _log_results(result: DetectionResult):
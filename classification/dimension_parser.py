@@ -16,6 +16,7 @@ Handles every format you see on commercial plan sets:
 from __future__ import annotations
 
 import re
+from collections.abc import Callable
 from dataclasses import dataclass
 
 from utils.logger import get_logger
@@ -29,7 +30,7 @@ _ANY_INCH = f"[{_INCH_MARKS}]"
 _ANY_FOOT = f"[{_FOOT_MARKS}]"
 
 
-@dataclass
+@dataclass(slots=True)
 class Dimension:
     raw: str                # Original text as found
     value_inches: float     # Converted to inches (0 if not linear)
@@ -129,22 +130,16 @@ def parse_dimensions(text: str) -> list[Dimension]:
     dims = []
     seen = set()
 
-    for finder in [
-        _find_elevations,
-        _find_steel,
-        _find_rebar,
-        _find_pipe,
-        _find_conduit,
-        _find_duct,
-        _find_ft_in,
-        _find_metric,
-        _find_bare_inch,
-        _find_bare_feet,
-    ]:
-        for dim in finder(text):
-            key = dim.raw.strip()
-            if key not in seen:
-                seen.add(key)
+    # Dedup on the matched text before building anything, so overlapping
+    # patterns (bare inches inside ft-in, duct sizes, ...) cost no objects
+    for pattern, make in _DIM_PATTERNS:
+        for m in pattern.finditer(text):
+            raw = m.group(0).strip()
+            if raw in seen:
+                continue
+            dim = make(m, raw)
+            if dim is not None:
+                seen.add(raw)
                 dims.append(dim)
 
     return dims
@@ -162,115 +157,90 @@ def to_inches(feet: float = 0, inches: float = 0, fraction_num: int = 0, fractio
     return (feet * 12) + inches + frac
 
 
-# ── Finder functions ──────────────────────────────────────
-
-def _find_ft_in(text: str) -> list[Dimension]:
-    dims = []
-    for m in _FT_IN.finditer(text):
-        ft = int(m.group(1))
-        inch = int(m.group(2))
-        frac_n = int(m.group(3)) if m.group(3) else 0
-        frac_d = int(m.group(4)) if m.group(4) else 1
-        total = to_inches(ft, inch, frac_n, frac_d)
-        raw = m.group(0).strip()
-        display = f"{ft}'-{inch}"
-        if frac_n:
-            display += f" {frac_n}/{frac_d}"
-        display += '"'
-        dims.append(Dimension(raw=raw, value_inches=total, value_display=display, dim_type="linear", unit="ft-in"))
-    return dims
-
-
-def _find_bare_feet(text: str) -> list[Dimension]:
-    dims = []
-    for m in _BARE_FEET.finditer(text):
-        ft = int(m.group(1))
-        dims.append(Dimension(raw=m.group(0).strip(), value_inches=ft * 12, value_display=f"{ft}'", dim_type="linear", unit="ft"))
-    return dims
-
-
-def _find_bare_inch(text: str) -> list[Dimension]:
-    dims = []
-    for m in _BARE_INCH.finditer(text):
-        val = float(m.group(1))
-        dims.append(Dimension(raw=m.group(0).strip(), value_inches=val, value_display=f'{val:.0f}"' if val == int(val) else f'{val}"', dim_type="linear", unit="in"))
-    # Also get fractions
-    for m in _FRAC_INCH.finditer(text):
-        n, d = int(m.group(1)), int(m.group(2))
-        val = n / d if d else 0
-        dims.append(Dimension(raw=m.group(0).strip(), value_inches=val, value_display=f'{n}/{d}"', dim_type="linear", unit="in"))
-    return dims
-
-
-def _find_metric(text: str) -> list[Dimension]:
-    dims = []
-    for m in _METRIC_MM.finditer(text):
-        val = float(m.group(1))
-        dims.append(Dimension(raw=m.group(0).strip(), value_inches=val / 25.4, value_display=f"{val:.0f}mm", dim_type="metric", unit="mm"))
-    for m in _METRIC_M.finditer(text):
-        val = float(m.group(1))
-        dims.append(Dimension(raw=m.group(0).strip(), value_inches=val * 39.3701, value_display=f"{val}m", dim_type="metric", unit="m"))
-    return dims
-
-
-def _find_elevations(text: str) -> list[Dimension]:
-    dims = []
-    for m in _ELEVATION.finditer(text):
-        raw = m.group(0).strip()
-        elev_str = m.group(1) if m.lastindex else ""
-        # Try to parse the elevation value
-        sub_dims = _find_ft_in(elev_str) or _find_bare_feet(elev_str)
-        val = sub_dims[0].value_inches if sub_dims else 0
-        dims.append(Dimension(raw=raw, value_inches=val, value_display=raw, dim_type="elevation", unit="ft-in"))
-    return dims
-
-
-def _find_steel(text: str) -> list[Dimension]:
-    dims = []
-    for m in _W_SHAPE.finditer(text):
-        raw = m.group(0).strip()
-        dims.append(Dimension(raw=raw, value_inches=0, value_display=raw, dim_type="steel"))
-    for m in _HSS.finditer(text):
-        raw = m.group(0).strip()
-        dims.append(Dimension(raw=raw, value_inches=0, value_display=raw, dim_type="steel"))
-    for m in _ANGLE.finditer(text):
-        raw = m.group(0).strip()
-        dims.append(Dimension(raw=raw, value_inches=0, value_display=raw, dim_type="steel"))
-    return dims
-
-
-def _find_rebar(text: str) -> list[Dimension]:
-    dims = []
-    for m in _REBAR.finditer(text):
-        raw = m.group(0).strip()
-        if not raw or len(raw) < 2:
-            continue
-        dims.append(Dimension(raw=raw, value_inches=0, value_display=raw, dim_type="rebar"))
-    return dims
-
-
-def _find_pipe(text: str) -> list[Dimension]:
-    dims = []
-    for m in _PIPE.finditer(text):
-        raw = m.group(0).strip()
-        dims.append(Dimension(raw=raw, value_inches=0, value_display=raw, dim_type="pipe"))
-    return dims
-
-
-def _find_duct(text: str) -> list[Dimension]:
-    dims = []
-    for m in _DUCT_ROUND.finditer(text):
-        raw = m.group(0).strip()
-        dims.append(Dimension(raw=raw, value_inches=0, value_display=raw, dim_type="duct"))
-    for m in _DUCT_RECT.finditer(text):
-        raw = m.group(0).strip()
-        dims.append(Dimension(raw=raw, value_inches=0, value_display=raw, dim_type="duct"))
-    return dims
-
-
-def _find_conduit(text: str) -> list[Dimension]:
-    dims = []
-    for m in _CONDUIT.finditer(text):
-        raw = m.group(0).strip()
-        dims.append(Dimension(raw=raw, value_inches=0, value_display=raw, dim_type="conduit"))
-    return dims
+# ── Dimension builders ────────────────────────────────
+# Each takes a match and its stripped text and returns a Dimension, or
+# None to skip the match.
+
+def _make_ft_in(m: re.Match, raw: str) -> Dimension:
+    ft = int(m.group(1))
+    inch = int(m.group(2))
+    frac_n = int(m.group(3)) if m.group(3) else 0
+    frac_d = int(m.group(4)) if m.group(4) else 1
+    total = to_inches(ft, inch, frac_n, frac_d)
+    display = f"{ft}'-{inch}"
+    if frac_n:
+        display += f" {frac_n}/{frac_d}"
+    display += '"'
+    return Dimension(raw=raw, value_inches=total, value_display=display, dim_type="linear", unit="ft-in")
+
+
+def _make_bare_feet(m: re.Match, raw: str) -> Dimension:
+    ft = int(m.group(1))
+    return Dimension(raw=raw, value_inches=ft * 12, value_display=f"{ft}'", dim_type="linear", unit="ft")
+
+
+def _make_bare_inch(m: re.Match, raw: str) -> Dimension:
+    val = float(m.group(1))
+    return Dimension(raw=raw, value_inches=val, value_display=f'{val:.0f}"' if val == int(val) else f'{val}"', dim_type="linear", unit="in")
+
+
+def _make_frac_inch(m: re.Match, raw: str) -> Dimension:
+    n, d = int(m.group(1)), int(m.group(2))
+    val = n / d if d else 0
+    return Dimension(raw=raw, value_inches=val, value_display=f'{n}/{d}"', dim_type="linear", unit="in")
+
+
+def _make_mm(m: re.Match, raw: str) -> Dimension:
+    val = float(m.group(1))
+    return Dimension(raw=raw, value_inches=val / 25.4, value_display=f"{val:.0f}mm", dim_type="metric", unit="mm")
+
+
+def _make_m(m: re.Match, raw: str) -> Dimension:
+    val = float(m.group(1))
+    return Dimension(raw=raw, value_inches=val * 39.3701, value_display=f"{val}m", dim_type="metric", unit="m")
+
+
+def _make_elevation(m: re.Match, raw: str) -> Dimension:
+    elev_str = m.group(1) if m.lastindex else ""
+    # Try to parse the elevation value
+    sub = _FT_IN.search(elev_str)
+    if sub:
+        val = _make_ft_in(sub, "").value_inches
+    else:
+        sub = _BARE_FEET.search(elev_str)
+        val = int(sub.group(1)) * 12 if sub else 0
+    return Dimension(raw=raw, value_inches=val, value_display=raw, dim_type="elevation", unit="ft-in")
+
+
+def _make_rebar(m: re.Match, raw: str) -> Dimension | None:
+    if not raw or len(raw) < 2:
+        return None
+    return Dimension(raw=raw, value_inches=0, value_display=raw, dim_type="rebar")
+
+
+def _as_is(dim_type: str):
+    """Builder for size callouts kept verbatim (steel, pipe, duct, conduit)."""
+    def make(m: re.Match, raw: str) -> Dimension:
+        return Dimension(raw=raw, value_inches=0, value_display=raw, dim_type=dim_type)
+    return make
+
+
+# (pattern, builder) in priority order — when two patterns match the same
+# text, the earlier one decides its type
+_DIM_PATTERNS: tuple[tuple[re.Pattern, Callable[[re.Match, str], Dimension | None]], ...] = (
+    (_ELEVATION, _make_elevation),
+    (_W_SHAPE, _as_is("steel")),
+    (_HSS, _as_is("steel")),
+    (_ANGLE, _as_is("steel")),
+    (_REBAR, _make_rebar),
+    (_PIPE, _as_is("pipe")),
+    (_CONDUIT, _as_is("conduit")),
+    (_DUCT_ROUND, _as_is("duct")),
+    (_DUCT_RECT, _as_is("duct")),
+    (_FT_IN, _make_ft_in),
+    (_METRIC_MM, _make_mm),
+    (_METRIC_M, _make_m),
+    (_BARE_INCH, _make_bare_inch),
+    (_FRAC_INCH, _make_frac_inch),
+    (_BARE_FEET, _make_bare_feet),
+)
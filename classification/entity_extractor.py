@@ -11,6 +11,7 @@ Built for commercial construction drawing sets.
 """
 from __future__ import annotations
 
+from collections import defaultdict
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
@@ -25,7 +26,7 @@ if TYPE_CHECKING:
 log = get_logger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class SheetEntities:
     """All extracted entities from a single classified sheet."""
     sheet_id: str
@@ -126,6 +127,19 @@ def extract_all_entities(
     return results
 
 
+_XREF_CATEGORIES = (
+    "drawing_refs",
+    "spec_refs",
+    "callouts",
+    "equipment_tags",
+    "room_refs",
+    "door_marks",
+    "window_marks",
+    "grid_refs",
+    "code_refs",
+)
+
+
 def build_cross_reference_index(entities_list: list[SheetEntities]) -> dict:
     """
     Build a cross-reference index from all extracted entities.
@@ -139,44 +153,20 @@ def build_cross_reference_index(entities_list: list[SheetEntities]) -> dict:
         ...
     }
     """
-    index = {
-        "drawing_refs": {},
-        "spec_refs": {},
-        "callouts": {},
-        "equipment_tags": {},
-        "room_refs": {},
-        "door_marks": {},
-        "window_marks": {},
-        "grid_refs": {},
-        "code_refs": {},
-    }
+    # Accumulate source sheets into sets, then sort each once
+    sources = {category: defaultdict(set) for category in _XREF_CATEGORIES}
 
     for ent in entities_list:
         sid = ent.sheet_id
+        parsed = ent.parsed
+        for category, by_value in sources.items():
+            for ref in getattr(parsed, category):
+                by_value[ref.value].add(sid)
 
-        for ref in ent.parsed.drawing_refs:
-            index["drawing_refs"].setdefault(ref.value, []).append(sid)
-        for ref in ent.parsed.spec_refs:
-            index["spec_refs"].setdefault(ref.value, []).append(sid)
-        for ref in ent.parsed.callouts:
-            index["callouts"].setdefault(ref.value, []).append(sid)
-        for ref in ent.parsed.equipment_tags:
-            index["equipment_tags"].setdefault(ref.value, []).append(sid)
-        for ref in ent.parsed.room_refs:
-            index["room_refs"].setdefault(ref.value, []).append(sid)
-        for ref in ent.parsed.door_marks:
-            index["door_marks"].setdefault(ref.value, []).append(sid)
-        for ref in ent.parsed.window_marks:
-            index["window_marks"].setdefault(ref.value, []).append(sid)
-        for ref in ent.parsed.grid_refs:
-            index["grid_refs"].setdefault(ref.value, []).append(sid)
-        for ref in ent.parsed.code_refs:
-            index["code_refs"].setdefault(ref.value, []).append(sid)
-
-    # Deduplicate source lists
-    for category in index.values():
-        for key in category:
-            category[key] = sorted(set(category[key]))
+    index = {
+        category: {value: sorted(sids) for value, sids in by_value.items()}
+        for category, by_value in sources.items()
+    }
 
     _log_xref_summary(index)
     return index
@@ -24,7 +24,7 @@ if TYPE_CHECKING:
 log = get_logger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class ClassifiedSheet:
     page: int
     sheet_id: str              # Normalized: A-101, S-201, M-001
@@ -205,14 +205,31 @@ def classify_single(page: PageResult) -> ClassifiedSheet:
 
 # ── Pass 1: Prefix matching ──────────────────────────────
 
+# Every prefix pattern is "^" + letters + ..., so only patterns starting
+# with the sheet ID's first letter can match. Compiled once and bucketed
+# by that letter, keeping SHEET_PREFIX_PATTERNS order within each bucket.
+_PREFIX_PATTERNS = [
+    (re.compile(pattern, re.IGNORECASE), (code, name, divisions))
+    for pattern, code, name, divisions in SHEET_PREFIX_PATTERNS
+]
+_PREFIX_BY_LETTER: dict[str, list] = {}
+for _entry in _PREFIX_PATTERNS:
+    _PREFIX_BY_LETTER.setdefault(_entry[0].pattern[1].upper(), []).append(_entry)
+del _entry
+
+
 def _classify_by_prefix(sheet_id: str) -> Optional[tuple[str, str, list[str]]]:
     """Match sheet ID against known discipline prefixes."""
     if not sheet_id:
         return None
 
-    for pattern, code, name, divisions in SHEET_PREFIX_PATTERNS:
-        if re.match(pattern, sheet_id, re.IGNORECASE):
-            return (code, name, divisions)
+    first = sheet_id[0].upper()
+    # Non-ASCII first letters can still case-fold onto a prefix (e.g. "ſ"),
+    # so those check the full list
+    candidates = _PREFIX_BY_LETTER.get(first, ()) if first.isascii() else _PREFIX_PATTERNS
+    for pattern, result in candidates:
+        if pattern.match(sheet_id):
+            return result
 
     return None
 
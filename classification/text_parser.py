@@ -21,10 +21,15 @@ from dataclasses import dataclass, field
 
 from utils.logger import get_logger
 
+try:
+    import re2
+except ImportError:
+    re2 = None  # optional — linear-time scans of ASCII sheet text
+
 log = get_logger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedToken:
     token_type: str    # "spec_ref", "note", "callout", "equipment", "grid", "room", "door", "window", "drawing_ref", "code_ref", "keynote"
     raw: str           # Original text
@@ -33,7 +38,7 @@ class ParsedToken:
     line_num: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedSheet:
     """All tokens extracted from a single sheet."""
     spec_refs: list[ParsedToken] = field(default_factory=list)
@@ -161,6 +166,54 @@ _NOTE_ITEM = re.compile(
 )
 
 
+_SCAN_PATTERNS = (
+    _SPEC_REF, _CALLOUT, _DRAWING_REF, _EQUIPMENT, _ROOM, _DOOR,
+    _WINDOW, _GRID, _CODE_REF, _KEYNOTE_NUMBERED, _NOTE_ITEM,
+)
+
+
+def _check_re2_safe(pattern: re.Pattern):
+    """
+    RE2 has no VERBOSE mode, so a twin compiles the pattern text as-is.
+    Whitespace or a # comment in a VERBOSE pattern would be literal to RE2
+    and ignored by re — refuse it rather than let the engines disagree.
+    Flags other than IGNORECASE / MULTILINE aren't carried over either.
+    """
+    if pattern.flags & ~(re.IGNORECASE | re.MULTILINE | re.VERBOSE | re.UNICODE):
+        raise ValueError(f"Scan pattern uses flags RE2 twins don't support: {pattern.pattern!r}")
+    if pattern.flags & re.VERBOSE and re.search(r"[\s#]", pattern.pattern):
+        raise ValueError(
+            f"VERBOSE scan pattern has whitespace or '#', which RE2 would "
+            f"match literally: {pattern.pattern!r}"
+        )
+
+
+# Checked whether or not re2 is installed, so a pattern edit fails here
+# instead of only on machines that have it
+for _pattern in _SCAN_PATTERNS:
+    _check_re2_safe(_pattern)
+del _pattern
+
+
+def _re2_twin(pattern: re.Pattern):
+    """Compile the same expression with RE2, carrying over IGNORECASE / MULTILINE."""
+    flags = ("i" if pattern.flags & re.IGNORECASE else "") + ("m" if pattern.flags & re.MULTILINE else "")
+    return re2.compile(f"(?{flags}){pattern.pattern}" if flags else pattern.pattern)
+
+
+# RE2 versions of the scan patterns. RE2's \s, \d, \w and \b are
+# ASCII-only, so they are used only on pure-ASCII text, where they match
+# exactly what the re patterns do; anything else (NBSP, curly quotes from
+# PDFs) goes through re
+_RE2_TWINS = {p: _re2_twin(p) for p in _SCAN_PATTERNS} if re2 is not None else {}
+
+
+def _finditer(pattern: re.Pattern, text: str, ascii_text: bool):
+    if ascii_text:
+        pattern = _RE2_TWINS.get(pattern, pattern)
+    return pattern.finditer(text)
+
+
 def parse_sheet_text(text: str) -> ParsedSheet:
     """
     Parse all entities from a single sheet's text content.
@@ -168,16 +221,17 @@ def parse_sheet_text(text: str) -> ParsedSheet:
     result = ParsedSheet()
     if not text or len(text) < 10:
         return result
+    ascii_text = text.isascii()
 
     # Spec references
-    for m in _SPEC_REF.finditer(text):
+    for m in _finditer(_SPEC_REF, text, ascii_text):
         code = f"{m.group(1)} {m.group(2)} {m.group(3)}"
         result.spec_refs.append(ParsedToken(
             token_type="spec_ref", raw=m.group(0).strip(), value=code,
         ))
 
     # Detail/section callouts
-    for m in _CALLOUT.finditer(text):
+    for m in _finditer(_CALLOUT, text, ascii_text):
         detail = m.group(1)
         sheet = m.group(2).upper().replace(" ", "")
         result.callouts.append(ParsedToken(
@@ -185,45 +239,45 @@ def parse_sheet_text(text: str) -> ParsedSheet:
         ))
 
     # Drawing cross-references
-    for m in _DRAWING_REF.finditer(text):
+    for m in _finditer(_DRAWING_REF, text, ascii_text):
         ref = m.group(1).upper().strip()
         result.drawing_refs.append(ParsedToken(
             token_type="drawing_ref", raw=m.group(0).strip(), value=ref,
         ))
 
     # Equipment tags
-    for m in _EQUIPMENT.finditer(text):
+    for m in _finditer(_EQUIPMENT, text, ascii_text):
         tag = f"{m.group(1)}-{m.group(2)}".upper()
         result.equipment_tags.append(ParsedToken(
             token_type="equipment", raw=m.group(0).strip(), value=tag,
         ))
 
     # Room references
-    for m in _ROOM.finditer(text):
+    for m in _finditer(_ROOM, text, ascii_text):
         result.room_refs.append(ParsedToken(
             token_type="room", raw=m.group(0).strip(), value=m.group(1).upper(),
         ))
 
     # Door marks
-    for m in _DOOR.finditer(text):
+    for m in _finditer(_DOOR, text, ascii_text):
         result.door_marks.append(ParsedToken(
             token_type="door", raw=m.group(0).strip(), value=f"D-{m.group(1).upper()}",
         ))
 
     # Window marks
-    for m in _WINDOW.finditer(text):
+    for m in _finditer(_WINDOW, text, ascii_text):
         result.window_marks.append(ParsedToken(
             token_type="window", raw=m.group(0).strip(), value=f"W-{m.group(1).upper()}",
         ))
 
     # Grid references
-    for m in _GRID.finditer(text):
+    for m in _finditer(_GRID, text, ascii_text):
         result.grid_refs.append(ParsedToken(
             token_type="grid", raw=m.group(0).strip(), value=m.group(1).upper(),
         ))
 
     # Code references
-    for m in _CODE_REF.finditer(text):
+    for m in _finditer(_CODE_REF, text, ascii_text):
         code_name = m.group(1).upper()
         code_ver = m.group(2).strip()
         result.code_refs.append(ParsedToken(
@@ -231,7 +285,7 @@ def parse_sheet_text(text: str) -> ParsedSheet:
         ))
 
     # Keynotes
-    for m in _KEYNOTE_NUMBERED.finditer(text):
+    for m in _finditer(_KEYNOTE_NUMBERED, text, ascii_text):
         num = m.group(1)
         content = m.group(2).strip()
         result.keynotes.append(ParsedToken(
@@ -239,7 +293,7 @@ def parse_sheet_text(text: str) -> ParsedSheet:
         ))
 
     # General notes
-    for m in _NOTE_ITEM.finditer(text):
+    for m in _finditer(_NOTE_ITEM, text, ascii_text):
         content = m.group(2).strip()
         if len(content) > 15:  # filter out short junk
             result.notes.append(ParsedToken(
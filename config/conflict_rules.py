@@ -913,20 +913,32 @@ _r("CR-160", "Smoke control system not coordinated",
 #  HELPERS
 # ═══════════════════════════════════════════════════════════
 
+# Rule positions keyed by discipline code, in registration order — lets
+# get_rules_for_disciplines() touch only rules that share a discipline
+_RULE_LIST: tuple[ConflictRule, ...] = tuple(CONFLICT_RULES.values())
+_RULES_BY_DISC: dict[str, list[int]] = {}
+for _pos, _rule in enumerate(_RULE_LIST):
+    for _disc in set(_rule.disciplines):
+        _RULES_BY_DISC.setdefault(_disc, []).append(_pos)
+del _pos, _rule, _disc
+
+
 def get_rules_for_disciplines(disc_codes: set[str]) -> list[ConflictRule]:
     """Return rules that apply to the given set of disciplines present in the drawing set."""
+    overlap: dict[int, int] = {}
+    for code in disc_codes:
+        for pos in _RULES_BY_DISC.get(code, ()):
+            overlap[pos] = overlap.get(pos, 0) + 1
+
     applicable = []
-    for rule in CONFLICT_RULES.values():
+    for pos in sorted(overlap):
+        rule = _RULE_LIST[pos]
         if not rule.enabled:
             continue
         # Rule applies if at least 2 of its disciplines are present (for cross-disc rules)
         # or if it's a single-discipline rule and that discipline is present
-        overlap = set(rule.disciplines) & disc_codes
-        if len(rule.disciplines) == 1 and overlap:
-            applicable.append(rule)
-        elif len(overlap) >= 2:
-            applicable.append(rule)
-        elif len(overlap) >= 1 and rule.detection_type == "code":
+        n = overlap[pos]
+        if len(rule.disciplines) == 1 or n >= 2 or rule.detection_type == "code":
             applicable.append(rule)
     return applicable
 
@@ -7,6 +7,7 @@ or fixed durations for activities that don't scale with SF.
 Based on RS Means, industry benchmarks, and GC scheduling experience
 for commercial construction (stick-built, structural steel, tilt-up).
 """
+from collections.abc import Iterable
 
 # Duration per 1000 SF — formula: rate * (SF / 1000), min 1 day
 # Calibrated for 20,000-150,000 SF commercial buildings
@@ -81,3 +82,14 @@ def get_duration(activity_code: str, building_type: str, square_feet: int) -> in
     rate = rates.get(building_type, rates.get("office", 0.15))
     days = max(2, round(rate * (square_feet / 1000)))
     return days
+
+
+def get_durations_bulk(
+    activity_codes: Iterable[str], building_type: str, square_feet: int,
+) -> dict[str, int]:
+    """
+    get_duration() for many activity codes at one building type and size.
+
+    Returns {activity_code: working days}.
+    """
+    return {code: get_duration(code, building_type, square_feet) for code in activity_codes}
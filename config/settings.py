@@ -33,6 +33,10 @@ MAX_UPLOAD_MB = 500
 # Supported file extensions
 SUPPORTED_EXTENSIONS = {".pdf", ".docx", ".doc"}
 
+# ── Output ─────────────────────────────────────────────
+# Write RFI logs with xlsxwriter's constant_memory mode when it is installed
+USE_XLSXWRITER = True
+
 # ── Scheduling ─────────────────────────────────────────
 DEFAULT_WORKDAYS_PER_WEEK = 5
 DEFAULT_HOURS_PER_DAY = 8
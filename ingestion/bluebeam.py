@@ -74,12 +74,16 @@ _MEASUREMENT_PATTERN = re.compile(
 )
 
 
-def extract_bluebeam_markups(file_path: Path | str) -> list[BluebeamMarkup]:
+def extract_bluebeam_markups(
+    file_path: Path | str, doc: fitz.Document | None = None,
+) -> list[BluebeamMarkup]:
     """
     Extract all Bluebeam markups from a PDF.
 
     Goes beyond basic annotations to pull Bluebeam-specific metadata
     like status, labels, layers, and measurement values.
+
+    Pass an already-open ``doc`` to reuse it; it is left open for the caller.
     """
     file_path = Path(file_path)
     if not file_path.exists():
@@ -88,7 +92,9 @@ def extract_bluebeam_markups(file_path: Path | str) -> list[BluebeamMarkup]:
     log.info("Extracting Bluebeam markups from: %s", file_path.name)
     markups = []
 
-    doc = fitz.open(str(file_path))
+    own_doc = doc is None
+    if own_doc:
+        doc = fitz.open(str(file_path))
 
     for page_idx in range(len(doc)):
         page = doc[page_idx]
@@ -117,7 +123,8 @@ def extract_bluebeam_markups(file_path: Path | str) -> list[BluebeamMarkup]:
             markups.append(markup)
 
     page_count = len(doc)
-    doc.close()
+    if own_doc:
+        doc.close()
     log.info("Found %d Bluebeam markups across %d pages", len(markups), page_count)
     return markups
 
@@ -108,36 +108,35 @@ def route_files(file_paths: list[Path | str], run_ocr: bool = True) -> list[File
 def _process_pdf(file_path: Path, result: FileIngestionResult, run_ocr: bool) -> FileIngestionResult:
     """Handle PDF files — could be drawings or specs."""
     try:
-        # Get page count
-        doc = fitz.open(str(file_path))
-        result.page_count = len(doc)
-        doc.close()
-
-        # Classify: drawing vs spec
-        result.file_type = _classify_pdf_type(file_path)
-        log.info("Classified %s as: %s", file_path.name, result.file_type)
-
-        if result.file_type == "spec":
-            result.spec_sections = read_spec(file_path)
-        else:
-            # Extract as drawing set
-            result.pages = extract_pdf(file_path)
-
-            # Extract Bluebeam markups
-            result.bluebeam_markups = extract_bluebeam_markups(file_path)
-
-            # OCR pages that need it
-            if run_ocr:
-                ocr_count = 0
-                for page in result.pages:
-                    if page.method == "needs_ocr":
-                        text = ocr_page(file_path, page.page)
-                        if text:
-                            page.text = text
-                            page.text_length = len(text)
-                            page.method = "ocr"
-                            ocr_count += 1
-                result.ocr_pages_processed = ocr_count
+        # Open once and share the parsed document with every extractor
+        with fitz.open(str(file_path)) as doc:
+            result.page_count = len(doc)
+
+            # Classify: drawing vs spec
+            result.file_type = _classify_pdf_type(file_path, doc)
+            log.info("Classified %s as: %s", file_path.name, result.file_type)
+
+            if result.file_type == "spec":
+                result.spec_sections = read_spec(file_path)
+            else:
+                # Extract as drawing set
+                result.pages = extract_pdf(file_path, doc)
+
+                # Extract Bluebeam markups
+                result.bluebeam_markups = extract_bluebeam_markups(file_path, doc)
+
+                # OCR pages that need it
+                if run_ocr:
+                    ocr_count = 0
+                    for page in result.pages:
+                        if page.method == "needs_ocr":
+                            text = ocr_page(file_path, page.page, doc)
+                            if text:
+                                page.text = text
+                                page.text_length = len(text)
+                                page.method = "ocr"
+                                ocr_count += 1
+                    result.ocr_pages_processed = ocr_count
 
     except Exception as e:
         log.error("Failed to process PDF %s: %s", file_path.name, e)
@@ -146,7 +145,7 @@ def _process_pdf(file_path: Path, result: FileIngestionResult, run_ocr: bool) ->
     return result
 
 
-def _classify_pdf_type(file_path: Path) -> str:
+def _classify_pdf_type(file_path: Path, doc: fitz.Document | None = None) -> str:
     """
     Determine if a PDF is a drawing set or a specification document.
 
@@ -155,9 +154,12 @@ def _classify_pdf_type(file_path: Path) -> str:
     - Drawings have less text, large page sizes (ARCH D, E, etc.)
     - Specs have CSI section headers ("SECTION 03 30 00")
     """
-    doc = fitz.open(str(file_path))
+    own_doc = doc is None
+    if own_doc:
+        doc = fitz.open(str(file_path))
     if len(doc) == 0:
-        doc.close()
+        if own_doc:
+            doc.close()
         return "unknown"
 
     # Sample first few pages
@@ -182,7 +184,8 @@ def _classify_pdf_type(file_path: Path) -> str:
             if re.search(r"SECTION\s+\d{2}\s?\d{2}\s?\d{2}", text, re.IGNORECASE):
                 has_section_header = True
 
-    doc.close()
+    if own_doc:
+        doc.close()
 
     # Decision logic
     avg_text = total_text / sample_size if sample_size else 0
@@ -10,6 +10,7 @@ If Tesseract is not available, logs a warning and returns empty text.
 from __future__ import annotations
 
 import fitz
+from functools import cache
 from pathlib import Path
 
 from config.settings import TESSERACT_CMD, OCR_DPI
@@ -17,64 +18,66 @@ from utils.logger import get_logger
 
 log = get_logger(__name__)
 
-_TESSERACT_AVAILABLE = None
 
+@cache
+def _tesseract_available() -> bool:
+    """
+    Check if Tesseract is installed and accessible.
 
-def _check_tesseract() -> bool:
-    """Check if Tesseract is installed and accessible."""
-    global _TESSERACT_AVAILABLE
-    if _TESSERACT_AVAILABLE is not None:
-        return _TESSERACT_AVAILABLE
-
+    Probed on first OCR use, not at import, so modules that never OCR don't
+    pay for the subprocess or log the warning; the result is then reused.
+    """
     try:
         import pytesseract
         pytesseract.pytesseract.tesseract_cmd = TESSERACT_CMD
         pytesseract.get_tesseract_version()
-        _TESSERACT_AVAILABLE = True
         log.info("Tesseract OCR available")
+        return True
     except Exception:
-        _TESSERACT_AVAILABLE = False
         log.warning("Tesseract OCR not available — scanned pages will have no text")
-
-    return _TESSERACT_AVAILABLE
+        return False
 
 
-def ocr_page(file_path: Path | str, page_num: int) -> str:
+def ocr_page(file_path: Path | str, page_num: int, doc: fitz.Document | None = None) -> str:
     """
     OCR a single page of a PDF.
 
     Args:
         file_path: Path to the PDF
         page_num: 1-based page number
+        doc: Already-open document to reuse (left open for the caller)
 
     Returns:
         Extracted text, or empty string if OCR is unavailable.
     """
-    if not _check_tesseract():
+    if not _tesseract_available():
         return ""
 
     import pytesseract
     from PIL import Image
-    import io
 
     file_path = Path(file_path)
-    doc = fitz.open(str(file_path))
+    own_doc = doc is None
+    if own_doc:
+        doc = fitz.open(str(file_path))
 
     if page_num < 1 or page_num > len(doc):
-        doc.close()
+        if own_doc:
+            doc.close()
         return ""
 
     page = doc[page_num - 1]
     log.debug("OCR page %d of %s at %d DPI", page_num, file_path.name, OCR_DPI)
 
-    # Rasterize page to image
+    # Rasterize page and hand the raw RGB samples straight to PIL —
+    # no PNG encode/decode round trip.
     mat = fitz.Matrix(OCR_DPI / 72, OCR_DPI / 72)
-    pix = page.get_pixmap(matrix=mat)
-    img_bytes = pix.tobytes("png")
-    doc.close()
+    pix = page.get_pixmap(matrix=mat, alpha=False)
+    img = Image.frombuffer("RGB", (pix.width, pix.height), pix.samples, "raw", "RGB", pix.stride, 1)
+    if own_doc:
+        doc.close()
 
     # Run OCR
-    img = Image.open(io.BytesIO(img_bytes))
     try:
         text = pytesseract.image_to_string(img, lang="eng")
         log.debug("OCR extracted %d chars from page %d", len(text), page_num)
@@ -84,16 +87,25 @@ def ocr_page(file_path: Path | str, page_num: int) -> str:
         return ""
 
 
-def ocr_pages(file_path: Path | str, page_nums: list[int]) -> dict[int, str]:
+def ocr_pages(
+    file_path: Path | str, page_nums: list[int], doc: fitz.Document | None = None,
+) -> dict[int, str]:
     """
     OCR multiple pages. Returns {page_num: text}.
     """
-    results = {}
-    for pn in page_nums:
-        results[pn] = ocr_page(file_path, pn)
-    return results
+    if not page_nums or not _tesseract_available():
+        return {pn: "" for pn in page_nums}
+
+    own_doc = doc is None
+    if own_doc:
+        doc = fitz.open(str(file_path))
+    try:
+        return {pn: ocr_page(file_path, pn, doc) for pn in page_nums}
+    finally:
+        if own_doc:
+            doc.close()
 
 
 def is_available() -> bool:
     """Check if OCR capability is available."""
-    return _check_tesseract()
+    return _tesseract_available()
@@ -12,10 +12,15 @@ Requires PyMuPDF (fitz). Gracefully returns empty list if not installed.
 """
 from __future__ import annotations
 
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 
+try:
+    import fitz  # PyMuPDF
+except ImportError:
+    fitz = None  # optional — extract_markups() returns [] without it
 
-@dataclass
+
+@dataclass(slots=True)
 class Markup:
     sheet_id: str
     markup_type: str       # callout, measurement, text, cloud, highlight, stamp, polyline
@@ -28,7 +33,17 @@ class Markup:
     y: float = 0.0
 
     def to_dict(self):
-        return asdict(self)
+        return {
+            "sheet_id": self.sheet_id,
+            "markup_type": self.markup_type,
+            "label": self.label,
+            "content": self.content,
+            "author": self.author,
+            "color": self.color,
+            "page_number": self.page_number,
+            "x": self.x,
+            "y": self.y,
+        }
 
 
 # Map PDF annotation type codes to human-readable names
@@ -45,8 +60,21 @@ _ANNOT_TYPE_MAP = {
     19: "text",         # Widget (form fields)
 }
 
+# Markup sets reuse a handful of colors — cache the RGB float -> hex conversion
+_color_cache: dict[tuple[float, ...], str] = {}
+
+
+def _color_hex(color_tuple) -> str:
+    """Convert a PyMuPDF 0-1 float RGB tuple to "#rrggbb", memoized."""
+    key = tuple(color_tuple[:3])
+    color = _color_cache.get(key)
+    if color is None:
+        r, g, b = [int(c * 255) for c in key]
+        color = _color_cache[key] = f"#{r:02x}{g:02x}{b:02x}"
+    return color
 
-def extract_markups(pdf_path: str, sheet_id: str = "") -> list[Markup]:
+
+def extract_markups(pdf_path: str, sheet_id: str = "", doc: fitz.Document | None = None) -> list[Markup]:
     """
     Extract all annotations/markups from a PDF file.
 
@@ -55,24 +83,27 @@ def extract_markups(pdf_path: str, sheet_id: str = "") -> list[Markup]:
     - Bluebeam Revu markups (saved as PDF annotations)
     - Bluebeam .bfx files (internally PDF format)
 
+    Pass an already-open ``doc`` to reuse it; it is left open for the caller.
+
     Returns list of Markup objects.
     """
-    try:
-        import fitz  # PyMuPDF
-    except ImportError:
+    if fitz is None:
         return []
 
     markups = []
 
-    try:
-        doc = fitz.open(pdf_path)
-    except Exception:
-        return []
+    own_doc = doc is None
+    if own_doc:
+        try:
+            doc = fitz.open(pdf_path)
+        except Exception:
+            return []
 
+    type_lookup = _ANNOT_TYPE_MAP.get
     for page_num, page in enumerate(doc):
         for annot in page.annots() or []:
             annot_type = annot.type[0]
-            type_name = _ANNOT_TYPE_MAP.get(annot_type, "other")
+            type_name = type_lookup(annot_type, "other")
 
             # Get the text content
             content = (annot.info.get("content", "") or "").strip()
@@ -88,8 +119,7 @@ def extract_markups(pdf_path: str, sheet_id: str = "") -> list[Markup]:
             # Color
             color_tuple = annot.colors.get("stroke") or annot.colors.get("fill")
             if color_tuple:
-                r, g, b = [int(c * 255) for c in color_tuple[:3]]
-                color = f"#{r:02x}{g:02x}{b:02x}"
+                color = _color_hex(color_tuple)
             else:
                 color = "#ff0000"
 
@@ -114,7 +144,8 @@ def extract_markups(pdf_path: str, sheet_id: str = "") -> list[Markup]:
                 y=y,
             ))
 
-    doc.close()
+    if own_doc:
+        doc.close()
     return markups
 
 
@@ -18,7 +18,6 @@ Returns a list of PageResult dicts, one per page:
 from __future__ import annotations
 
 import fitz  # PyMuPDF
-import pdfplumber
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -27,8 +26,24 @@ from utils.logger import get_logger
 
 log = get_logger(__name__)
 
+# Plain-text extraction flags plus image blocks, so image bboxes come from
+# the same TextPage as the text.
+_TEXTPAGE_FLAGS = fitz.TEXTFLAGS_TEXT | fitz.TEXT_PRESERVE_IMAGES
 
-@dataclass
+# pdfplumber pulls in pdfminer.six (slow to import) and is only needed for
+# sparse pages and table extraction — load it on first use.
+_pdfplumber = None
+
+
+def _get_pdfplumber():
+    global _pdfplumber
+    if _pdfplumber is None:
+        import pdfplumber
+        _pdfplumber = pdfplumber
+    return _pdfplumber
+
+
+@dataclass(slots=True)
 class PageResult:
     page: int
     text: str = ""
@@ -54,7 +69,7 @@ class PageResult:
         }
 
 
-def extract_pdf(file_path: Path | str) -> list[PageResult]:
+def extract_pdf(file_path: Path | str, doc: fitz.Document | None = None) -> list[PageResult]:
     """
     Extract text, annotations, and metadata from every page of a PDF.
 
@@ -62,6 +77,9 @@ def extract_pdf(file_path: Path | str) -> list[PageResult]:
     1. PyMuPDF text extraction (fast, preserves layout)
     2. If text is too short → try pdfplumber (better with tables/forms)
     3. If still too short → flag for OCR (handled by image_ocr module)
+
+    Pass an already-open ``doc`` to skip re-parsing the file; it is left
+    open for the caller to close.
     """
     file_path = Path(file_path)
     if not file_path.exists():
@@ -70,7 +88,9 @@ def extract_pdf(file_path: Path | str) -> list[PageResult]:
     log.info("Opening PDF: %s", file_path.name)
     results = []
 
-    doc = fitz.open(str(file_path))
+    own_doc = doc is None
+    if own_doc:
+        doc = fitz.open(str(file_path))
     log.info("PDF has %d pages, size %.1f MB", len(doc), file_path.stat().st_size / 1e6)
 
     for page_idx in range(len(doc)):
@@ -81,8 +101,12 @@ def extract_pdf(file_path: Path | str) -> list[PageResult]:
             height=page.rect.height,
         )
 
+        # One TextPage serves both text and image placements, so the page
+        # content stream is only interpreted once.
+        textpage = page.get_textpage(flags=_TEXTPAGE_FLAGS)
+
         # ── Step 1: PyMuPDF text extraction ────────────
-        text = page.get_text("text")
+        text = page.get_text("text", textpage=textpage)
         if text:
             pr.text = text.strip()
             pr.text_length = len(pr.text)
@@ -105,11 +129,13 @@ def extract_pdf(file_path: Path | str) -> list[PageResult]:
         pr.annotations = _extract_annotations(page)
 
         # ── Extract image info (bounding boxes, not pixels) ─
-        pr.images = _extract_image_info(page)
+        pr.images = _extract_image_info(page, textpage)
+        del textpage
 
         results.append(pr)
 
-    doc.close()
+    if own_doc:
+        doc.close()
     log.info(
         "Extracted %d pages: %d pymupdf, %d pdfplumber, %d need OCR",
         len(results),
@@ -124,7 +150,7 @@ def extract_tables(file_path: Path | str, page_num: int) -> list[list]:
     """Extract tables from a specific page using pdfplumber."""
     file_path = Path(file_path)
     try:
-        with pdfplumber.open(str(file_path)) as pdf:
+        with _get_pdfplumber().open(str(file_path)) as pdf:
             if page_num < 1 or page_num > len(pdf.pages):
                 return []
             page = pdf.pages[page_num - 1]
@@ -148,7 +174,7 @@ def get_page_count(file_path: Path | str) -> int:
 def _pdfplumber_extract(file_path: Path, page_idx: int) -> str:
     """Try pdfplumber on a single page."""
     try:
-        with pdfplumber.open(str(file_path)) as pdf:
+        with _get_pdfplumber().open(str(file_path)) as pdf:
             if page_idx < len(pdf.pages):
                 text = pdf.pages[page_idx].extract_text()
                 return text or ""
@@ -173,19 +199,48 @@ def _extract_annotations(page: fitz.Page) -> list[dict]:
     return annots
 
 
-def _extract_image_info(page: fitz.Page) -> list[dict]:
-    """Get bounding boxes and sizes of embedded images (not the pixels)."""
-    images = []
+def _extract_image_info(page: fitz.Page, textpage: fitz.TextPage | None = None) -> list[dict]:
+    """
+    Get bounding boxes and sizes of embedded images (not the pixels).
+
+    "xref" is the image each placement draws, or None when it can't be
+    resolved (e.g. inline images, or identical pixels stored under two xrefs).
+    """
+    if textpage is None:
+        textpage = page.get_textpage(flags=_TEXTPAGE_FLAGS)
+
+    # Resolve xrefs by pixel dimensions from the resource list (cheap — no
+    # content-stream walk or image decode)
+    xrefs_by_size: dict[tuple[int, int], set[int]] = {}
     for img in page.get_images(full=True):
-        xref = img[0]
-        try:
-            bbox = page.get_image_bbox(img)
-            images.append({
-                "xref": xref,
-                "bbox": list(bbox),
-                "width": img[2],
-                "height": img[3],
-            })
-        except Exception:
-            pass
+        xrefs_by_size.setdefault((img[2], img[3]), set()).add(img[0])
+
+    # Sizes shared by several xrefs fall back to matching image digests,
+    # decoding only the colliding xrefs
+    shared = [xrefs for xrefs in xrefs_by_size.values() if len(xrefs) > 1]
+    xref_by_digest: dict[bytes, int | None] = {}
+    for xrefs in shared:
+        for xref in xrefs:
+            try:
+                digest = fitz.Pixmap(page.parent, xref).digest
+            except Exception:
+                continue
+            xref_by_digest[digest] = None if digest in xref_by_digest else xref
+
+    images = []
+    for info in textpage.extractIMGINFO(hashes=bool(shared)):
+        size = (info["width"], info["height"])
+        candidates = xrefs_by_size.get(size, ())
+        if len(candidates) == 1:
+            xref = next(iter(candidates))
+        elif candidates:
+            xref = xref_by_digest.get(info["digest"])
+        else:
+            xref = None
+        images.append({
+            "xref": xref,
+            "bbox": list(info["bbox"]),
+            "width": info["width"],
+            "height": info["height"],
+        })
     return images
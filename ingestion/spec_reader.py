@@ -8,6 +8,7 @@ so the conflict detector can cross-reference drawings against specs.
 from __future__ import annotations
 
 import re
+import fitz
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -28,7 +29,7 @@ _PART_HEADER = re.compile(
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class SpecSection:
     section_code: str      # "03 30 00"
     section_name: str      # "CAST-IN-PLACE CONCRETE"
@@ -44,13 +45,15 @@ def read_spec_pdf(file_path: Path | str) -> list[SpecSection]:
     file_path = Path(file_path)
     log.info("Reading spec PDF: %s", file_path.name)
 
-    import fitz
     doc = fitz.open(str(file_path))
 
-    full_text = ""
+    # Text blocks only (type 0) — skips per-character layout work, and
+    # list-join avoids quadratic string growth on thousand-page specs.
+    page_texts = []
     for page in doc:
-        full_text += page.get_text("text") + "\n"
+        page_texts.append("".join(b[4] for b in page.get_text("blocks") if b[6] == 0))
     doc.close()
+    full_text = "\n".join(page_texts) + "\n"
 
     return _parse_spec_text(full_text)
 
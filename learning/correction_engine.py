@@ -9,7 +9,7 @@ Uses feedback history to:
 from __future__ import annotations
 
 from analysis.conflict_detector import DetectionResult, Conflict
-from learning.feedback_store import get_suppressed_rules, get_false_positives, get_feedback
+from learning.feedback_store import get_correction_data
 from utils.logger import get_logger
 
 log = get_logger(__name__)
@@ -25,37 +25,29 @@ def apply_corrections(
     - Marks conflicts as suppressed if the rule was suppressed by feedback
     - Adjusts severity based on historical patterns
     """
-    # Get suppressed rules
-    suppressed = get_suppressed_rules(project_id)
-
-    # Get specific false positive conflict IDs
-    false_pos = get_false_positives(project_id)
-
-    # Get feedback history for severity patterns
-    feedback = get_feedback(project_id)
-    severity_overrides = _build_severity_map(feedback)
+    # Suppressed rules, specific false positive conflict IDs, and
+    # aggregated severity changes — one read per call
+    suppressed, false_pos, severity_counts = get_correction_data(project_id)
+    severity_overrides = _build_severity_map(severity_counts)
+
+    # Resolve every conflict's suppression and severity override up front,
+    # then apply them in one pass
+    conflicts = result.conflicts
+    suppress_mask = [
+        c.rule_id in suppressed or c.conflict_id in false_pos for c in conflicts
+    ]
+    new_severities = [severity_overrides.get(c.rule_id) for c in conflicts]
 
     corrections_applied = 0
-
-    for conflict in result.conflicts:
-        # Suppress by rule
-        if conflict.rule_id in suppressed:
+    for conflict, suppress, new_sev in zip(conflicts, suppress_mask, new_severities):
+        if suppress:
+            # Suppress by rule or by specific conflict
             conflict.suppressed = True
             corrections_applied += 1
-            continue
-
-        # Suppress by specific conflict
-        if conflict.conflict_id in false_pos:
-            conflict.suppressed = True
+        elif new_sev is not None and new_sev != conflict.severity:
+            # Adjust severity
+            conflict.severity = new_sev
             corrections_applied += 1
-            continue
-
-        # Adjust severity
-        if conflict.rule_id in severity_overrides:
-            old = conflict.severity
-            conflict.severity = severity_overrides[conflict.rule_id]
-            if old != conflict.severity:
-                corrections_applied += 1
 
     if corrections_applied:
         log.info("Applied %d corrections from feedback history", corrections_applied)
@@ -63,29 +55,15 @@ def apply_corrections(
     return result
 
 
-def _build_severity_map(feedback: list[dict]) -> dict[str, str]:
+def _build_severity_map(severity_counts) -> dict[str, str]:
     """
     Build a severity override map from feedback history.
 
-    If a user has consistently changed the severity of a rule,
-    apply that override automatically.
+    If a user has consistently changed the severity of a rule (3+ times),
+    apply that override automatically. Rows arrive pre-aggregated and
+    pre-filtered from feedback_store, most frequent severity first per rule.
     """
-    # Count severity changes per rule
-    changes: dict[str, dict[str, int]] = {}
-    for fb in feedback:
-        if fb["action"] == "severity_change" and fb.get("adjusted_severity"):
-            rule_key = fb.get("conflict_id", "").split("-")[0] if fb.get("conflict_id") else ""
-            if rule_key:
-                changes.setdefault(rule_key, {})
-                adj = fb["adjusted_severity"]
-                changes[rule_key][adj] = changes[rule_key].get(adj, 0) + 1
-
-    # Only override if user has made 3+ consistent changes
-    overrides = {}
-    for rule_id, sev_counts in changes.items():
-        if sev_counts:
-            top_sev = max(sev_counts, key=sev_counts.get)
-            if sev_counts[top_sev] >= 3:
-                overrides[rule_id] = top_sev
-
+    overrides: dict[str, str] = {}
+    for rule_key, severity, _count in severity_counts:
+        overrides.setdefault(rule_key, severity)
     return overrides
@@ -11,12 +11,23 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from utils.db import get_conn
+from utils.db import DATABASE_URL, pooled_conn
 from utils.logger import get_logger
 
 log = get_logger(__name__)
 
 
+# Rule key = conflict_id up to the first "-" (whole ID when there is none)
+_RULE_PREFIX_SQL = (
+    "split_part(conflict_id, '-', 1)" if DATABASE_URL else
+    "CASE WHEN instr(conflict_id, '-') > 0 "
+    "THEN substr(conflict_id, 1, instr(conflict_id, '-') - 1) ELSE conflict_id END"
+)
+
+# Severity changes needed before a rule's severity is overridden
+SEVERITY_OVERRIDE_MIN = 3
+
+
 def record_feedback(
     project_id: int,
     conflict_id: str,
@@ -26,40 +37,76 @@ def record_feedback(
     user_note: str = "",
 ) -> int:
     """Record user feedback on a conflict. Returns feedback row ID."""
-    conn = get_conn()
-    cursor = conn.execute(
-        """INSERT INTO feedback
-           (project_id, conflict_id, action, original_severity, adjusted_severity, user_note)
-           VALUES (?, ?, ?, ?, ?, ?)""",
-        (project_id, conflict_id, action, original_severity, adjusted_severity, user_note),
-    )
-    conn.commit()
-    row_id = cursor.lastrowid
-    conn.close()
+    with pooled_conn() as conn:
+        cursor = conn.execute(
+            """INSERT INTO feedback
+               (project_id, conflict_id, action, original_severity, adjusted_severity, user_note)
+               VALUES (?, ?, ?, ?, ?, ?)""",
+            (project_id, conflict_id, action, original_severity, adjusted_severity, user_note),
+        )
+        conn.commit()
+        row_id = cursor.lastrowid
     log.info("Feedback recorded: %s on %s (ID=%d)", action, conflict_id, row_id)
     return row_id
 
 
+def record_feedback_bulk(project_id: int, entries: list[dict]) -> int:
+    """
+    Record many feedback entries in one transaction. Each entry takes the
+    same keys as record_feedback's arguments. Returns the number inserted.
+    """
+    rows = [
+        (
+            project_id,
+            e.get("conflict_id", ""),
+            e.get("action", "note"),
+            e.get("original_severity", ""),
+            e.get("adjusted_severity", ""),
+            e.get("user_note", ""),
+        )
+        for e in entries
+    ]
+    if not rows:
+        return 0
+
+    with pooled_conn() as conn:
+        conn.executemany(
+            """INSERT INTO feedback
+               (project_id, conflict_id, action, original_severity, adjusted_severity, user_note)
+               VALUES (?, ?, ?, ?, ?, ?)""",
+            rows,
+        )
+        conn.commit()
+    log.info("Feedback recorded: %d entries for project %d", len(rows), project_id)
+    return len(rows)
+
+
 def get_feedback(project_id: int) -> list[dict]:
     """Get all feedback for a project."""
-    conn = get_conn()
-    rows = conn.execute(
-        "SELECT * FROM feedback WHERE project_id = ? ORDER BY created_at DESC",
-        (project_id,),
-    ).fetchall()
-    conn.close()
-    return [dict(r) for r in rows]
+    with pooled_conn() as conn:
+        return _query_feedback(conn, project_id)
+
+
+def get_action_counts(project_id: int) -> dict[str, int]:
+    """Count a project's feedback by action, plus "total", in one query."""
+    with pooled_conn() as conn:
+        row = conn.execute(
+            """SELECT
+                   COALESCE(SUM(CASE WHEN action = 'accepted' THEN 1 ELSE 0 END), 0) AS accepted,
+                   COALESCE(SUM(CASE WHEN action = 'false_positive' THEN 1 ELSE 0 END), 0) AS false_positive,
+                   COALESCE(SUM(CASE WHEN action = 'severity_change' THEN 1 ELSE 0 END), 0) AS severity_change,
+                   COALESCE(SUM(CASE WHEN action = 'note' THEN 1 ELSE 0 END), 0) AS note,
+                   COUNT(*) AS total
+               FROM feedback WHERE project_id = ?""",
+            (project_id,),
+        ).fetchone()
+    return {k: int(row[k]) for k in ("accepted", "false_positive", "severity_change", "note", "total")}
 
 
 def get_false_positives(project_id: int) -> set[str]:
     """Get conflict IDs marked as false positives."""
-    conn = get_conn()
-    rows = conn.execute(
-        "SELECT conflict_id FROM feedback WHERE project_id = ? AND action = 'false_positive'",
-        (project_id,),
-    ).fetchall()
-    conn.close()
-    return {r["conflict_id"] for r in rows}
+    with pooled_conn() as conn:
+        return _query_false_positives(conn, project_id)
 
 
 def record_rule_adjustment(
@@ -69,15 +116,14 @@ def record_rule_adjustment(
     project_id: int | None = None,
 ) -> int:
     """Record a rule adjustment. project_id=None means global."""
-    conn = get_conn()
-    cursor = conn.execute(
-        """INSERT INTO rule_adjustments (project_id, rule_id, adjustment_type, value)
-           VALUES (?, ?, ?, ?)""",
-        (project_id, rule_id, adjustment_type, value),
-    )
-    conn.commit()
-    row_id = cursor.lastrowid
-    conn.close()
+    with pooled_conn() as conn:
+        cursor = conn.execute(
+            """INSERT INTO rule_adjustments (project_id, rule_id, adjustment_type, value)
+               VALUES (?, ?, ?, ?)""",
+            (project_id, rule_id, adjustment_type, value),
+        )
+        conn.commit()
+        row_id = cursor.lastrowid
     scope = f"project {project_id}" if project_id else "global"
     log.info("Rule adjustment: %s %s (%s, ID=%d)", adjustment_type, rule_id, scope, row_id)
     return row_id
@@ -85,20 +131,74 @@ def record_rule_adjustment(
 
 def get_suppressed_rules(project_id: int | None = None) -> set[str]:
     """Get rule IDs that are suppressed (project-specific + global)."""
-    conn = get_conn()
-    # Global suppressions
+    with pooled_conn() as conn:
+        return _query_suppressed_rules(conn, project_id)
+
+
+def get_severity_change_counts(project_id: int) -> list[tuple[str, str, int]]:
+    """
+    Return (rule_key, adjusted_severity, count) for severity changes made at
+    least SEVERITY_OVERRIDE_MIN times, most frequent first per rule (ties go
+    to the most recently recorded severity).
+    """
+    with pooled_conn() as conn:
+        return _query_severity_change_counts(conn, project_id)
+
+
+def get_correction_data(
+    project_id: int,
+) -> tuple[set[str], set[str], list[tuple[str, str, int]]]:
+    """
+    Return (suppressed rules, false-positive conflict IDs, severity change
+    counts) for apply_corrections, read over one connection.
+    """
+    with pooled_conn() as conn:
+        suppressed = _query_suppressed_rules(conn, project_id)
+        false_pos = _query_false_positives(conn, project_id)
+        severity_counts = _query_severity_change_counts(conn, project_id)
+    return suppressed, false_pos, severity_counts
+
+
+# ── Private query helpers (caller owns the connection) ─────
+
+def _query_feedback(conn, project_id: int) -> list[dict]:
     rows = conn.execute(
-        "SELECT rule_id FROM rule_adjustments WHERE adjustment_type = 'suppress' AND project_id IS NULL",
+        "SELECT * FROM feedback WHERE project_id = ? ORDER BY created_at DESC",
+        (project_id,),
     ).fetchall()
-    suppressed = {r["rule_id"] for r in rows}
+    return [dict(r) for r in rows]
 
-    # Project-specific suppressions
-    if project_id:
-        rows = conn.execute(
-            "SELECT rule_id FROM rule_adjustments WHERE adjustment_type = 'suppress' AND project_id = ?",
-            (project_id,),
-        ).fetchall()
-        suppressed.update(r["rule_id"] for r in rows)
 
-    conn.close()
+def _query_false_positives(conn, project_id: int) -> set[str]:
+    rows = conn.execute(
+        "SELECT conflict_id FROM feedback WHERE project_id = ? AND action = 'false_positive'",
+        (project_id,),
+    ).fetchall()
+    return {r["conflict_id"] for r in rows}
+
+
+def _query_severity_change_counts(conn, project_id: int) -> list[tuple[str, str, int]]:
+    rows = conn.execute(
+        f"""SELECT {_RULE_PREFIX_SQL} AS rule_key, adjusted_severity, COUNT(*) AS n
+            FROM feedback
+            WHERE project_id = ? AND action = 'severity_change'
+              AND adjusted_severity <> '' AND conflict_id <> ''
+            GROUP BY rule_key, adjusted_severity
+            HAVING COUNT(*) >= ?
+            ORDER BY rule_key, n DESC, MAX(id) DESC""",
+        (project_id, SEVERITY_OVERRIDE_MIN),
+    ).fetchall()
+    return [(r["rule_key"], r["adjusted_severity"], r["n"]) for r in rows]
+
+
+def _query_suppressed_rules(conn, project_id: int | None) -> set[str]:
+    # Global suppressions plus project-specific ones; a NULL bind matches
+    # only the global branch
+    rows = conn.execute(
+        """SELECT rule_id FROM rule_adjustments
+           WHERE adjustment_type = 'suppress' AND (project_id IS NULL OR project_id = ?)""",
+        (project_id or None,),
+    ).fetchall()
+    suppressed = {r["rule_id"] for r in rows}
+
     return suppressed
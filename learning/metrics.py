@@ -11,7 +11,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
-from learning.feedback_store import get_feedback
+from learning.feedback_store import get_action_counts
 from utils.logger import get_logger
 
 log = get_logger(__name__)
@@ -41,20 +41,14 @@ class AccuracyMetrics:
 
 def calculate_metrics(project_id: int) -> AccuracyMetrics:
     """Calculate accuracy metrics from feedback for a project."""
-    feedback = get_feedback(project_id)
-    metrics = AccuracyMetrics()
-
-    for fb in feedback:
-        metrics.total_conflicts += 1
-        action = fb.get("action", "")
-        if action == "accepted":
-            metrics.accepted += 1
-        elif action == "false_positive":
-            metrics.false_positives += 1
-        elif action == "severity_change":
-            metrics.severity_changes += 1
-        elif action == "note":
-            metrics.notes += 1
+    counts = get_action_counts(project_id)
+    metrics = AccuracyMetrics(
+        total_conflicts=counts["total"],
+        accepted=counts["accepted"],
+        false_positives=counts["false_positive"],
+        severity_changes=counts["severity_change"],
+        notes=counts["note"],
+    )
 
     if metrics.total_conflicts > 0:
         metrics.true_positive_rate = metrics.accepted / metrics.total_conflicts
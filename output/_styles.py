@@ -0,0 +1,41 @@
+"""
+Shared openpyxl style singletons for the Excel writers.
+
+Built once at import and assigned by reference, so every workbook reuses the
+same style objects instead of constructing equal ones per module or per cell.
+"""
+from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+
+
+def _solid(color: str) -> PatternFill:
+    return PatternFill(start_color=color, end_color=color, fill_type="solid")
+
+
+# ── Headers / titles ──────────────────────────────────────
+HEADER_FILL = _solid("00263A")
+HEADER_FONT = Font(bold=True, color="FFFFFF", size=11)
+TITLE_FONT = Font(bold=True, size=14)
+BOLD_FONT = Font(bold=True)
+
+BORDER = Border(
+    left=Side(style="thin"), right=Side(style="thin"),
+    top=Side(style="thin"), bottom=Side(style="thin"),
+)
+
+# ── Alignment ─────────────────────────────────────────────
+# RFI logs wrap long text; schedule rows stay single-line.
+RFI_HEADER_ALIGN = Alignment(horizontal="center", wrap_text=True)
+RFI_DATA_ALIGN = Alignment(wrap_text=True, vertical="top")
+SCHEDULE_HEADER_ALIGN = Alignment(horizontal="center")
+SCHEDULE_DATA_ALIGN = Alignment(vertical="top")
+
+# ── Fills ─────────────────────────────────────────────────
+# Severity color coding
+SEVERITY_FILLS = {
+    "CRITICAL": _solid("FF4444"),
+    "MAJOR":    _solid("FF5A19"),
+    "MINOR":    _solid("FFFF00"),
+    "INFO":     _solid("87CEEB"),
+}
+CRITICAL_FILL = _solid("FF5A19")
+MILESTONE_FILL = _solid("00263A")
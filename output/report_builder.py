@@ -10,6 +10,8 @@ Generates a single report with:
 """
 from __future__ import annotations
 
+from collections.abc import Iterable, Iterator
+from operator import attrgetter, itemgetter
 from pathlib import Path
 
 from classification.sheet_classifier import ClassifiedSheet
@@ -21,74 +23,93 @@ from utils.logger import get_logger
 log = get_logger(__name__)
 
 
-def build_text_report(
+def iter_report_lines(
     project_name: str,
     sheets: list[ClassifiedSheet],
     xref: CrossReferenceMap,
     detection: DetectionResult,
     rfi_log: RFILog,
-) -> str:
-    """Build a plain-text summary report."""
-    lines = []
-    lines.append("=" * 70)
-    lines.append(f"  DABO Plan Review Report")
-    lines.append(f"  Project: {project_name}")
-    lines.append(f"  Generated: {rfi_log.generated_date}")
-    lines.append("=" * 70)
+) -> Iterator[str]:
+    """Yield the plain-text summary report one line at a time."""
+    yield "=" * 70
+    yield f"  DABO Plan Review Report"
+    yield f"  Project: {project_name}"
+    yield f"  Generated: {rfi_log.generated_date}"
+    yield "=" * 70
 
     # ── Sheet Index ────────────────────────────────────────
-    lines.append(f"\nSHEET INDEX ({len(sheets)} sheets)")
-    lines.append("-" * 50)
-    for s in sorted(sheets, key=lambda x: x.sheet_id):
-        lines.append(f"  {s.sheet_id:10s} | {s.discipline_code:5s} | {s.discipline_name:25s} | {s.title[:30]}")
+    yield f"\nSHEET INDEX ({len(sheets)} sheets)"
+    yield "-" * 50
+    yield from (
+        f"  {s.sheet_id:10s} | {s.discipline_code:5s} | {s.discipline_name:25s} | {s.title[:30]}"
+        for s in sorted(sheets, key=attrgetter("sheet_id"))
+    )
 
     # ── Discipline Summary ─────────────────────────────────
-    lines.append(f"\nDISCIPLINE COVERAGE")
-    lines.append("-" * 50)
-    for code, sheet_ids in sorted(xref.disciplines_present.items()):
-        lines.append(f"  {code:5s}: {len(sheet_ids)} sheets ({', '.join(sheet_ids)})")
+    yield f"\nDISCIPLINE COVERAGE"
+    yield "-" * 50
+    for code, sheet_ids in sorted(xref.disciplines_present.items(), key=itemgetter(0)):
+        yield f"  {code:5s}: {len(sheet_ids)} sheets ({', '.join(sheet_ids)})"
 
     # ── Cross-Reference Summary ────────────────────────────
-    lines.append(f"\nCROSS-REFERENCE SUMMARY")
-    lines.append("-" * 50)
-    lines.append(f"  Drawing references: {len(xref.drawing_refs)} unique targets")
-    lines.append(f"  Spec sections:     {len(xref.all_spec_refs)} unique")
-    lines.append(f"  Equipment tags:    {len(xref.all_equipment)} unique")
-    lines.append(f"  Broken references: {len(xref.broken_refs)}")
+    yield f"\nCROSS-REFERENCE SUMMARY"
+    yield "-" * 50
+    yield f"  Drawing references: {len(xref.drawing_refs)} unique targets"
+    yield f"  Spec sections:     {len(xref.all_spec_refs)} unique"
+    yield f"  Equipment tags:    {len(xref.all_equipment)} unique"
+    yield f"  Broken references: {len(xref.broken_refs)}"
 
     if xref.broken_refs:
-        lines.append(f"\n  Broken References:")
+        yield f"\n  Broken References:"
         for br in xref.broken_refs:
-            lines.append(f"    {br.source_sheet} -> {br.target} ({br.ref_type})")
+            yield f"    {br.source_sheet} -> {br.target} ({br.ref_type})"
 
     # ── Conflict Summary ───────────────────────────────────
-    lines.append(f"\nCONFLICT DETECTION RESULTS")
-    lines.append("-" * 50)
-    lines.append(f"  Rules checked:     {detection.rules_checked}")
-    lines.append(f"  Rules triggered:   {detection.rules_triggered}")
-    lines.append(f"  Total conflicts:   {len(detection.conflicts)}")
-    lines.append(f"    CRITICAL:        {detection.critical_count}")
-    lines.append(f"    MAJOR:           {detection.major_count}")
-    lines.append(f"    MINOR:           {detection.minor_count}")
+    yield f"\nCONFLICT DETECTION RESULTS"
+    yield "-" * 50
+    yield f"  Rules checked:     {detection.rules_checked}"
+    yield f"  Rules triggered:   {detection.rules_triggered}"
+    yield f"  Total conflicts:   {len(detection.conflicts)}"
+    yield f"    CRITICAL:        {detection.critical_count}"
+    yield f"    MAJOR:           {detection.major_count}"
+    yield f"    MINOR:           {detection.minor_count}"
 
     # ── RFI Summary ────────────────────────────────────────
-    lines.append(f"\nRFI LOG SUMMARY")
-    lines.append("-" * 50)
-    lines.append(f"  Total RFIs:   {rfi_log.total}")
-    lines.append(f"  CRITICAL:     {rfi_log.critical_count}")
-    lines.append(f"  MAJOR:        {rfi_log.major_count}")
+    yield f"\nRFI LOG SUMMARY"
+    yield "-" * 50
+    yield f"  Total RFIs:   {rfi_log.total}"
+    yield f"  CRITICAL:     {rfi_log.critical_count}"
+    yield f"  MAJOR:        {rfi_log.major_count}"
+
+    yield "\n" + "=" * 70
+    yield "  End of Report"
+    yield "=" * 70
 
-    lines.append("\n" + "=" * 70)
-    lines.append("  End of Report")
-    lines.append("=" * 70)
 
-    return "\n".join(lines)
+def build_text_report(
+    project_name: str,
+    sheets: list[ClassifiedSheet],
+    xref: CrossReferenceMap,
+    detection: DetectionResult,
+    rfi_log: RFILog,
+) -> str:
+    """Build a plain-text summary report as a single string."""
+    return "\n".join(iter_report_lines(project_name, sheets, xref, detection, rfi_log))
+
 
+def write_report(report: str | Iterable[str], output_path: Path | str) -> Path:
+    """
+    Write report to a text file.
 
-def write_report(report_text: str, output_path: Path | str) -> Path:
-    """Write report to a text file."""
+    Accepts either the joined report string or the lines from
+    iter_report_lines(), which are streamed to disk without joining.
+    """
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(report_text, encoding="utf-8")
+    if isinstance(report, str):
+        output_path.write_text(report, encoding="utf-8")
+    else:
+        with output_path.open("w", encoding="utf-8") as f:
+            f.writelines(line + "\n" for line in report)
     log.info("Report written: %s", output_path.name)
     return output_path
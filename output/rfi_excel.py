@@ -8,133 +8,90 @@ Output format:
 """
 from __future__ import annotations
 
+from collections import Counter
 from pathlib import Path
 from datetime import datetime
 
 from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+from openpyxl.styles import PatternFill
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.utils import get_column_letter
 
-from analysis.rfi_generator import RFILog
+try:
+    import xlsxwriter
+except ImportError:  # optional — fall back to openpyxl write-only mode
+    xlsxwriter = None
+
+from analysis.rfi_generator import RFIEntry, RFILog
+from config.settings import USE_XLSXWRITER
+from output._styles import (
+    BOLD_FONT, BORDER, HEADER_FILL, HEADER_FONT, RFI_DATA_ALIGN, RFI_HEADER_ALIGN,
+    SEVERITY_FILLS, TITLE_FONT,
+)
 from utils.logger import get_logger
 
 log = get_logger(__name__)
 
-# Severity color coding
-_FILLS = {
-    "CRITICAL": PatternFill(start_color="FF4444", end_color="FF4444", fill_type="solid"),
-    "MAJOR":    PatternFill(start_color="FF5A19", end_color="FF5A19", fill_type="solid"),
-    "MINOR":    PatternFill(start_color="FFFF00", end_color="FFFF00", fill_type="solid"),
-    "INFO":     PatternFill(start_color="87CEEB", end_color="87CEEB", fill_type="solid"),
-}
-
-_HEADER_FILL = PatternFill(start_color="00263A", end_color="00263A", fill_type="solid")
-_HEADER_FONT = Font(bold=True, color="FFFFFF", size=11)
-_BORDER = Border(
-    left=Side(style="thin"), right=Side(style="thin"),
-    top=Side(style="thin"), bottom=Side(style="thin"),
-)
+_LOG_HEADERS = [
+    "RFI #", "Priority", "Severity", "Subject", "Description",
+    "Question", "Sheets", "Discipline", "Rule ID",
+    "Status", "Date", "Response",
+]
+_LOG_COL_WIDTHS = [8, 10, 10, 40, 50, 50, 20, 15, 10, 10, 12, 40]
+_SEVERITY_ORDER = ["CRITICAL", "MAJOR", "MINOR", "INFO"]
 
 
 def write_rfi_excel(rfi_log: RFILog, output_path: Path | str) -> Path:
     """
     Write an RFI log to an Excel workbook.
 
-    Returns the path to the created file.
+    Rows are streamed to disk (xlsxwriter constant_memory when available,
+    otherwise an openpyxl write-only workbook), so memory stays flat for
+    large logs. Returns the path to the created file.
     """
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    wb = Workbook()
+    if USE_XLSXWRITER and xlsxwriter is not None:
+        return _write_rfi_excel_xlsxwriter(rfi_log, output_path)
 
-    # ── Sheet 1: RFI Log ──────────────────────────────────
-    ws = wb.active
-    ws.title = "RFI Log"
+    wb = Workbook(write_only=True)
 
-    headers = [
-        "RFI #", "Priority", "Severity", "Subject", "Description",
-        "Question", "Sheets", "Discipline", "Rule ID",
-        "Status", "Date", "Response",
-    ]
-    col_widths = [8, 10, 10, 40, 50, 50, 20, 15, 10, 10, 12, 40]
-
-    # Write header
-    for col, (header, width) in enumerate(zip(headers, col_widths), 1):
-        cell = ws.cell(row=1, column=col, value=header)
-        cell.fill = _HEADER_FILL
-        cell.font = _HEADER_FONT
-        cell.alignment = Alignment(horizontal="center", wrap_text=True)
-        cell.border = _BORDER
-        ws.column_dimensions[get_column_letter(col)].width = width
-
-    # Write data rows
-    for row_idx, rfi in enumerate(rfi_log.rfis, 2):
-        values = [
-            rfi.rfi_number,
-            rfi.priority,
-            rfi.severity,
-            rfi.subject,
-            rfi.description,
-            rfi.question,
-            ", ".join(rfi.sheets_referenced),
-            rfi.discipline,
-            rfi.rule_id,
-            rfi.status,
-            rfi.created_date,
-            rfi.response,
-        ]
-        for col, val in enumerate(values, 1):
-            cell = ws.cell(row=row_idx, column=col, value=val)
-            cell.border = _BORDER
-            cell.alignment = Alignment(wrap_text=True, vertical="top")
-
-        # Color-code severity column
-        sev_cell = ws.cell(row=row_idx, column=3)
-        if rfi.severity in _FILLS:
-            sev_cell.fill = _FILLS[rfi.severity]
-
-        # Color-code priority column
-        pri_cell = ws.cell(row=row_idx, column=2)
-        if rfi.severity in _FILLS:
-            pri_cell.fill = _FILLS[rfi.severity]
-
-    # Freeze header row
+    # ── Sheet 1: RFI Log ──────────────────────────────────
+    ws = wb.create_sheet("RFI Log")
     ws.freeze_panes = "A2"
+    _append_header(ws, _LOG_HEADERS, _LOG_COL_WIDTHS)
+
+    # Write data rows, tallying the summary counts in the same pass
+    sev_counts: Counter[str] = Counter()
+    disc_counts: Counter[str] = Counter()
+    fills_get = SEVERITY_FILLS.get
+    for rfi in rfi_log.rfis:
+        sev_counts[rfi.severity] += 1
+        disc_counts[rfi.discipline] += 1
+        # Color-code priority and severity columns
+        _append_data_row(ws, _rfi_values(rfi), fills_get(rfi.severity))
 
     # ── Sheet 2: Summary ──────────────────────────────────
     ws2 = wb.create_sheet("Summary")
     ws2.column_dimensions["A"].width = 25
     ws2.column_dimensions["B"].width = 15
 
-    ws2.cell(row=1, column=1, value="DABO Plan Review Summary").font = Font(bold=True, size=14)
-    ws2.cell(row=2, column=1, value=f"Project: {rfi_log.project_name}")
-    ws2.cell(row=3, column=1, value=f"Generated: {rfi_log.generated_date}")
-    ws2.cell(row=4, column=1, value=f"Total RFIs: {rfi_log.total}")
+    ws2.append([_styled(ws2, "DABO Plan Review Summary", font=TITLE_FONT)])
+    ws2.append([f"Project: {rfi_log.project_name}"])
+    ws2.append([f"Generated: {rfi_log.generated_date}"])
+    ws2.append([f"Total RFIs: {rfi_log.total}"])
+    ws2.append([])
 
-    row = 6
-    ws2.cell(row=row, column=1, value="By Severity").font = Font(bold=True)
-    row += 1
-    sev_counts = {}
-    for rfi in rfi_log.rfis:
-        sev_counts[rfi.severity] = sev_counts.get(rfi.severity, 0) + 1
-    for sev in ["CRITICAL", "MAJOR", "MINOR", "INFO"]:
+    ws2.append([_styled(ws2, "By Severity", font=BOLD_FONT)])
+    for sev in _SEVERITY_ORDER:
         if sev in sev_counts:
-            ws2.cell(row=row, column=1, value=sev)
-            ws2.cell(row=row, column=2, value=sev_counts[sev])
-            if sev in _FILLS:
-                ws2.cell(row=row, column=1).fill = _FILLS[sev]
-            row += 1
+            ws2.append([_styled(ws2, sev, fill=SEVERITY_FILLS.get(sev)), sev_counts[sev]])
 
-    row += 1
-    ws2.cell(row=row, column=1, value="By Discipline").font = Font(bold=True)
-    row += 1
-    disc_counts = {}
-    for rfi in rfi_log.rfis:
-        disc_counts[rfi.discipline] = disc_counts.get(rfi.discipline, 0) + 1
-    for disc, count in sorted(disc_counts.items(), key=lambda x: -x[1]):
-        ws2.cell(row=row, column=1, value=disc)
-        ws2.cell(row=row, column=2, value=count)
-        row += 1
+    ws2.append([])
+    ws2.append([_styled(ws2, "By Discipline", font=BOLD_FONT)])
+    for disc, count in disc_counts.most_common():
+        ws2.append([disc, count])
 
     # ── Save ──────────────────────────────────────────────
     wb.save(str(output_path))
@@ -156,27 +113,21 @@ def write_rfi_excel_from_dicts(
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "RFI Log"
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("RFI Log")
+    ws.freeze_panes = "A2"
 
     headers = [
         "RFI #", "Priority", "Severity", "Subject",
         "Question", "Sheets", "Discipline", "Status",
     ]
     col_widths = [8, 10, 10, 40, 50, 20, 15, 10]
+    _append_header(ws, headers, col_widths)
 
-    for col, (header, width) in enumerate(zip(headers, col_widths), 1):
-        cell = ws.cell(row=1, column=col, value=header)
-        cell.fill = _HEADER_FILL
-        cell.font = _HEADER_FONT
-        cell.alignment = Alignment(horizontal="center", wrap_text=True)
-        cell.border = _BORDER
-        ws.column_dimensions[get_column_letter(col)].width = width
-
-    for row_idx, rfi in enumerate(rfis, 2):
+    fills_get = SEVERITY_FILLS.get
+    for idx, rfi in enumerate(rfis, 1):
         values = [
-            rfi.get("number", row_idx - 1),
+            rfi.get("number", idx),
             rfi.get("priority", ""),
             rfi.get("severity", ""),
             rfi.get("subject", ""),
@@ -185,27 +136,151 @@ def write_rfi_excel_from_dicts(
             rfi.get("discipline", ""),
             rfi.get("status", "Open"),
         ]
-        for col, val in enumerate(values, 1):
-            cell = ws.cell(row=row_idx, column=col, value=val)
-            cell.border = _BORDER
-            cell.alignment = Alignment(wrap_text=True, vertical="top")
-
-        sev = rfi.get("severity", "")
-        if sev in _FILLS:
-            ws.cell(row=row_idx, column=3).fill = _FILLS[sev]
-            ws.cell(row=row_idx, column=2).fill = _FILLS[sev]
-
-    ws.freeze_panes = "A2"
+        _append_data_row(ws, values, fills_get(rfi.get("severity", "")))
 
     # Summary sheet
     ws2 = wb.create_sheet("Summary")
     ws2.column_dimensions["A"].width = 25
     ws2.column_dimensions["B"].width = 15
-    ws2.cell(row=1, column=1, value="DABO Plan Review Summary").font = Font(bold=True, size=14)
-    ws2.cell(row=2, column=1, value=f"Project: {project_name}")
-    ws2.cell(row=3, column=1, value=f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}")
-    ws2.cell(row=4, column=1, value=f"Total RFIs: {len(rfis)}")
+    ws2.append([_styled(ws2, "DABO Plan Review Summary", font=TITLE_FONT)])
+    ws2.append([f"Project: {project_name}"])
+    ws2.append([f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}"])
+    ws2.append([f"Total RFIs: {len(rfis)}"])
 
     wb.save(str(output_path))
     log.info("RFI Excel (dict mode) written: %s (%d RFIs)", output_path.name, len(rfis))
     return output_path
+
+
+# ── Private helpers ─────────────────────────────────────
+
+def _rfi_values(rfi: RFIEntry) -> list:
+    """Row values for one RFI, in _LOG_HEADERS order."""
+    return [
+        rfi.rfi_number,
+        rfi.priority,
+        rfi.severity,
+        rfi.subject,
+        rfi.description,
+        rfi.question,
+        ", ".join(rfi.sheets_referenced),
+        rfi.discipline,
+        rfi.rule_id,
+        rfi.status,
+        rfi.created_date,
+        rfi.response,
+    ]
+
+
+def _write_rfi_excel_xlsxwriter(rfi_log: RFILog, output_path: Path) -> Path:
+    """write_rfi_excel via xlsxwriter constant_memory: each row is flushed as written."""
+    wb = xlsxwriter.Workbook(str(output_path), {"constant_memory": True})
+
+    border = {"border": 1}
+    data_fmt = wb.add_format({**border, "text_wrap": True, "valign": "top"})
+    header_fmt = wb.add_format({
+        **border, "bold": True, "font_color": "#FFFFFF", "font_size": 11,
+        "bg_color": "#00263A", "align": "center", "text_wrap": True,
+    })
+    sev_data_fmts = {
+        sev: wb.add_format({**border, "text_wrap": True, "valign": "top",
+                            "bg_color": "#" + fill.fgColor.rgb[-6:]})
+        for sev, fill in SEVERITY_FILLS.items()
+    }
+    sev_label_fmts = {
+        sev: wb.add_format({"bg_color": "#" + fill.fgColor.rgb[-6:]})
+        for sev, fill in SEVERITY_FILLS.items()
+    }
+
+    # ── Sheet 1: RFI Log ──────────────────────────────────
+    ws = wb.add_worksheet("RFI Log")
+    for col, width in enumerate(_LOG_COL_WIDTHS):
+        ws.set_column(col, col, width)
+    ws.freeze_panes(1, 0)
+    ws.write_row(0, 0, _LOG_HEADERS, header_fmt)
+
+    sev_counts: Counter[str] = Counter()
+    disc_counts: Counter[str] = Counter()
+    for row_idx, rfi in enumerate(rfi_log.rfis, 1):
+        sev_counts[rfi.severity] += 1
+        disc_counts[rfi.discipline] += 1
+        values = _rfi_values(rfi)
+        sev_fmt = sev_data_fmts.get(rfi.severity)
+        if sev_fmt is None:
+            ws.write_row(row_idx, 0, values, data_fmt)
+        else:
+            # Color-code priority and severity columns
+            ws.write(row_idx, 0, values[0], data_fmt)
+            ws.write_row(row_idx, 1, values[1:3], sev_fmt)
+            ws.write_row(row_idx, 3, values[3:], data_fmt)
+
+    # ── Sheet 2: Summary ──────────────────────────────────
+    ws2 = wb.add_worksheet("Summary")
+    ws2.set_column(0, 0, 25)
+    ws2.set_column(1, 1, 15)
+    ws2.write(0, 0, "DABO Plan Review Summary", wb.add_format({"bold": True, "font_size": 14}))
+    ws2.write(1, 0, f"Project: {rfi_log.project_name}")
+    ws2.write(2, 0, f"Generated: {rfi_log.generated_date}")
+    ws2.write(3, 0, f"Total RFIs: {rfi_log.total}")
+
+    bold = wb.add_format({"bold": True})
+    row = 5
+    ws2.write(row, 0, "By Severity", bold)
+    row += 1
+    for sev in _SEVERITY_ORDER:
+        if sev in sev_counts:
+            ws2.write(row, 0, sev, sev_label_fmts.get(sev))
+            ws2.write(row, 1, sev_counts[sev])
+            row += 1
+
+    row += 1
+    ws2.write(row, 0, "By Discipline", bold)
+    row += 1
+    for disc, count in disc_counts.most_common():
+        ws2.write(row, 0, disc)
+        ws2.write(row, 1, count)
+        row += 1
+
+    wb.close()
+    log.info("RFI Excel written: %s (%d RFIs)", output_path.name, rfi_log.total)
+    return output_path
+
+
+def _styled(ws, value, font=None, fill=None) -> WriteOnlyCell:
+    """Build a write-only cell with optional font/fill."""
+    cell = WriteOnlyCell(ws, value=value)
+    if font is not None:
+        cell.font = font
+    if fill is not None:
+        cell.fill = fill
+    return cell
+
+
+def _append_header(ws, headers: list[str], col_widths: list[int]):
+    """Set column widths and append the styled header row."""
+    for col, width in enumerate(col_widths, 1):
+        ws.column_dimensions[get_column_letter(col)].width = width
+
+    row = []
+    for header in headers:
+        cell = WriteOnlyCell(ws, value=header)
+        cell.fill = HEADER_FILL
+        cell.font = HEADER_FONT
+        cell.alignment = RFI_HEADER_ALIGN
+        cell.border = BORDER
+        row.append(cell)
+    ws.append(row)
+
+
+def _append_data_row(ws, values: list, severity_fill: PatternFill | None):
+    """Append one RFI row; priority and severity (columns 2-3) get the severity fill."""
+    row = []
+    for val in values:
+        cell = WriteOnlyCell(ws, value=val)
+        cell.border = BORDER
+        cell.alignment = RFI_DATA_ALIGN
+        row.append(cell)
+    if severity_fill is not None:
+        row[1].fill = severity_fill
+        row[2].fill = severity_fill
+    ws.append(row)
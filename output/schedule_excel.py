@@ -9,21 +9,35 @@ from __future__ import annotations
 from pathlib import Path
 
 from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+from openpyxl.styles import NamedStyle
 from openpyxl.utils import get_column_letter
 
+from output._styles import (
+    BORDER, CRITICAL_FILL, HEADER_FILL, HEADER_FONT, MILESTONE_FILL,
+    SCHEDULE_DATA_ALIGN, SCHEDULE_HEADER_ALIGN, TITLE_FONT,
+)
 from utils.logger import get_logger
 
 log = get_logger(__name__)
 
-_HEADER_FILL = PatternFill(start_color="00263A", end_color="00263A", fill_type="solid")
-_HEADER_FONT = Font(bold=True, color="FFFFFF", size=11)
-_CRITICAL_FILL = PatternFill(start_color="FF5A19", end_color="FF5A19", fill_type="solid")
-_MILESTONE_FILL = PatternFill(start_color="00263A", end_color="00263A", fill_type="solid")
-_BORDER = Border(
-    left=Side(style="thin"), right=Side(style="thin"),
-    top=Side(style="thin"), bottom=Side(style="thin"),
-)
+# Named styles for activity rows: cells reference one registered style
+# instead of carrying their own border/alignment/fill combination.
+_DATA_STYLE = "activity"
+_CRITICAL_STYLE = "critical_activity"
+_MILESTONE_STYLE = "milestone_activity"
+
+
+def _register_styles(wb: Workbook):
+    """Add the activity-row named styles to a workbook (once per workbook)."""
+    for name, fill in (
+        (_DATA_STYLE, None),
+        (_CRITICAL_STYLE, CRITICAL_FILL),
+        (_MILESTONE_STYLE, MILESTONE_FILL),
+    ):
+        style = NamedStyle(name=name, border=BORDER, alignment=SCHEDULE_DATA_ALIGN)
+        if fill is not None:
+            style.fill = fill
+        wb.add_named_style(style)
 
 
 def write_schedule_excel(
@@ -52,6 +66,7 @@ def write_schedule_excel(
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
     wb = Workbook()
+    _register_styles(wb)
 
     # ── Activities Sheet ──────────────────────────────────
     ws = wb.active
@@ -67,10 +82,10 @@ def write_schedule_excel(
 
     for col, (header, width) in enumerate(zip(headers, col_widths), 1):
         cell = ws.cell(row=1, column=col, value=header)
-        cell.fill = _HEADER_FILL
-        cell.font = _HEADER_FONT
-        cell.alignment = Alignment(horizontal="center")
-        cell.border = _BORDER
+        cell.fill = HEADER_FILL
+        cell.font = HEADER_FONT
+        cell.alignment = SCHEDULE_HEADER_ALIGN
+        cell.border = BORDER
         ws.column_dimensions[get_column_letter(col)].width = width
 
     for row_idx, act in enumerate(activities, 2):
@@ -97,20 +112,16 @@ def write_schedule_excel(
             "Y" if act.get("is_milestone") else "",
         ]
 
-        for col, val in enumerate(values, 1):
-            cell = ws.cell(row=row_idx, column=col, value=val)
-            cell.border = _BORDER
-            cell.alignment = Alignment(vertical="top")
-
-        # Color-code critical activities
-        if act.get("is_critical"):
-            for col in range(1, len(headers) + 1):
-                ws.cell(row=row_idx, column=col).fill = _CRITICAL_FILL
-
-        # Color-code milestones
+        # Color-code milestones, then critical activities (milestone wins)
         if act.get("is_milestone"):
-            for col in range(1, len(headers) + 1):
-                ws.cell(row=row_idx, column=col).fill = _MILESTONE_FILL
+            row_style = _MILESTONE_STYLE
+        elif act.get("is_critical"):
+            row_style = _CRITICAL_STYLE
+        else:
+            row_style = _DATA_STYLE
+
+        for col, val in enumerate(values, 1):
+            ws.cell(row=row_idx, column=col, value=val).style = row_style
 
     ws.freeze_panes = "A2"
 
@@ -119,7 +130,7 @@ def write_schedule_excel(
     ws2.column_dimensions["A"].width = 30
     ws2.column_dimensions["B"].width = 15
 
-    ws2.cell(row=1, column=1, value=f"Schedule: {project_name}").font = Font(bold=True, size=14)
+    ws2.cell(row=1, column=1, value=f"Schedule: {project_name}").font = TITLE_FONT
     ws2.cell(row=3, column=1, value="Total Activities")
     ws2.cell(row=3, column=2, value=len(activities))
     ws2.cell(row=4, column=1, value="Critical Activities")
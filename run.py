@@ -10,9 +10,6 @@ import sys
 import argparse
 from pathlib import Path
 
-# Add project root to path
-sys.path.insert(0, str(Path(__file__).resolve().parent))
-
 
 def main():
     parser = argparse.ArgumentParser(description="DABO — AI Plan Review & Scheduling Agent")
@@ -22,10 +19,7 @@ def main():
     parser.add_argument("--web", action="store_true", help="Launch Flask web dashboard (default)")
     args = parser.parse_args()
 
-    # Bootstrap database
-    from utils.db import init_db
-    init_db()
-
+    # Database bootstrap happens only in the modes that use it
     if args.test:
         _run_self_test()
     elif args.ingest:
@@ -79,9 +73,11 @@ def _run_self_test():
 
 def _run_ingest(file_path: str):
     """Quick CLI ingestion of a single file."""
+    from utils.db import init_db
     from utils.logger import get_logger
     from ingestion.file_router import route_file
 
+    init_db()
     log = get_logger("cli")
     path = Path(file_path)
 
@@ -122,7 +118,7 @@ def _run_ingest(file_path: str):
 
 def _launch_web():
     """Launch the Flask web dashboard."""
-    from web.app import create_app
+    from web.app import create_app  # create_app bootstraps the database
     app = create_app()
     print("\n  DABO Web Dashboard")
     print("  http://localhost:5000\n")
@@ -132,10 +128,14 @@ def _launch_web():
 def _launch_streamlit():
     """Launch the Streamlit dashboard (legacy)."""
     import subprocess
+    from utils.db import init_db
+    init_db()
     dashboard_path = Path(__file__).resolve().parent / "dashboard" / "app.py"
     print(f"Launching DABO Streamlit dashboard (legacy)...")
     subprocess.run([sys.executable, "-m", "streamlit", "run", str(dashboard_path)])
 
 
 if __name__ == "__main__":
+    # Add project root to path
+    sys.path.insert(0, str(Path(__file__).resolve().parent))
     main()
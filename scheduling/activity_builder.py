@@ -11,7 +11,13 @@ a standard activity list with durations and predecessor logic.
 """
 from __future__ import annotations
 
-from config.production_rates import get_duration, FIXED_DURATIONS
+import json
+import sys
+from collections import deque
+from functools import lru_cache
+from types import MappingProxyType
+
+from config.production_rates import get_durations_bulk, FIXED_DURATIONS
 from scheduling.cpm_engine import Activity
 from utils.logger import get_logger
 
@@ -25,61 +31,61 @@ log = get_logger(__name__)
 # ═══════════════════════════════════════════════════════════════
 _NEW_CONSTRUCTION = [
     # ── Preconstruction ───────────────────────────────────
-    ("01", "A0010", "Notice to Proceed",            [],                                        True),
-    ("01", "A0020", "Permits & Approvals",           [("A0010", "FS", 0)],                     True),
-    ("01", "A0030", "Shop Drawing Submittals",       [("A0010", "FS", 0)],                     False),
-    ("01", "A0040", "Material Procurement",          [("A0030", "FS", 5)],                     False),
+    ("01", "A0010", "Notice to Proceed",            (),                                        True),
+    ("01", "A0020", "Permits & Approvals",           (("A0010", "FS", 0),),                   True),
+    ("01", "A0030", "Shop Drawing Submittals",       (("A0010", "FS", 0),),                   False),
+    ("01", "A0040", "Material Procurement",          (("A0030", "FS", 5),),                   False),
 
     # ── Sitework ──────────────────────────────────────────
-    ("02", "A0100", "Mobilization",                  [("A0020", "FS", 0)],                     False),
-    ("02", "A0110", "Earthwork & Grading",           [("A0100", "FS", 0)],                     False),
-    ("02", "A0120", "Underground Utilities",         [("A0110", "FS", 0)],                     False),
+    ("02", "A0100", "Mobilization",                  (("A0020", "FS", 0),),                   False),
+    ("02", "A0110", "Earthwork & Grading",           (("A0100", "FS", 0),),                   False),
+    ("02", "A0120", "Underground Utilities",         (("A0110", "FS", 0),),                   False),
 
     # ── Foundations ────────────────────────────────────────
-    ("03", "A0200", "Foundations",                   [("A0120", "FS", 0)],                     False),
-    ("03", "A0210", "Slab on Grade",                 [("A0200", "FS", 0)],                     False),
+    ("03", "A0200", "Foundations",                   (("A0120", "FS", 0),),                   False),
+    ("03", "A0210", "Slab on Grade",                 (("A0200", "FS", 0),),                   False),
 
     # ── Structure ─────────────────────────────────────────
-    ("05", "A0300", "Structural Steel Erection",     [("A0200", "FS", 0), ("A0040", "FS", 0)], False),
-    ("05", "A0310", "Metal Deck & Shear Studs",      [("A0300", "SS", 5)],                     False),
-    ("03", "A0320", "Elevated Concrete Decks",       [("A0310", "FS", 0)],                     False),
+    ("05", "A0300", "Structural Steel Erection",     (("A0200", "FS", 0), ("A0040", "FS", 0)), False),
+    ("05", "A0310", "Metal Deck & Shear Studs",      (("A0300", "SS", 5),),                   False),
+    ("03", "A0320", "Elevated Concrete Decks",       (("A0310", "FS", 0),),                   False),
 
     # ── Envelope ──────────────────────────────────────────
-    ("07", "A0400", "Roofing",                       [("A0310", "FS", 5)],                     False),
-    ("07", "A0410", "Exterior Wall System",          [("A0300", "SS", 10)],                    False),
-    ("08", "A0420", "Windows & Storefront",          [("A0410", "SS", 10)],                    False),
-    ("07", "A0430", "Waterproofing & Sealants",      [("A0410", "SS", 15)],                    False),
+    ("07", "A0400", "Roofing",                       (("A0310", "FS", 5),),                   False),
+    ("07", "A0410", "Exterior Wall System",          (("A0300", "SS", 10),),                  False),
+    ("08", "A0420", "Windows & Storefront",          (("A0410", "SS", 10),),                  False),
+    ("07", "A0430", "Waterproofing & Sealants",      (("A0410", "SS", 15),),                  False),
 
     # ── MEP Rough-In ──────────────────────────────────────
-    ("15", "A0500", "HVAC Rough-In",                 [("A0320", "FS", 0)],                     False),
-    ("15", "A0510", "Plumbing Rough-In",             [("A0210", "FS", 0)],                     False),
-    ("16", "A0520", "Electrical Rough-In",           [("A0320", "FS", 0)],                     False),
-    ("15", "A0530", "Fire Protection",               [("A0320", "FS", 0)],                     False),
-    ("16", "A0540", "Fire Alarm Rough-In",           [("A0520", "SS", 5)],                     False),
-    ("16", "A0550", "Low Voltage Rough-In",          [("A0520", "SS", 5)],                     False),
+    ("15", "A0500", "HVAC Rough-In",                 (("A0320", "FS", 0),),                   False),
+    ("15", "A0510", "Plumbing Rough-In",             (("A0210", "FS", 0),),                   False),
+    ("16", "A0520", "Electrical Rough-In",           (("A0320", "FS", 0),),                   False),
+    ("15", "A0530", "Fire Protection",               (("A0320", "FS", 0),),                   False),
+    ("16", "A0540", "Fire Alarm Rough-In",           (("A0520", "SS", 5),),                   False),
+    ("16", "A0550", "Low Voltage Rough-In",          (("A0520", "SS", 5),),                   False),
 
     # ── Interior Finishes ─────────────────────────────────
-    ("09", "A0600", "Metal Framing & Drywall",       [("A0500", "SS", 10), ("A0520", "SS", 10)], False),
-    ("08", "A0610", "Doors & Hardware",              [("A0600", "SS", 15)],                    False),
-    ("09", "A0620", "Ceiling Grid & Tile",           [("A0600", "FS", 0), ("A0500", "FS", -5)], False),
-    ("09", "A0630", "Flooring",                      [("A0600", "FS", 0)],                     False),
-    ("09", "A0640", "Painting",                      [("A0600", "FS", 0)],                     False),
-    ("10", "A0650", "Specialties & Accessories",     [("A0640", "FS", 0)],                     False),
+    ("09", "A0600", "Metal Framing & Drywall",       (("A0500", "SS", 10), ("A0520", "SS", 10)), False),
+    ("08", "A0610", "Doors & Hardware",              (("A0600", "SS", 15),),                  False),
+    ("09", "A0620", "Ceiling Grid & Tile",           (("A0600", "FS", 0), ("A0500", "FS", -5)), False),
+    ("09", "A0630", "Flooring",                      (("A0600", "FS", 0),),                   False),
+    ("09", "A0640", "Painting",                      (("A0600", "FS", 0),),                   False),
+    ("10", "A0650", "Specialties & Accessories",     (("A0640", "FS", 0),),                   False),
 
     # ── MEP Trim ──────────────────────────────────────────
-    ("15", "A0700", "HVAC Trim & Startup",           [("A0620", "FS", 0)],                     False),
-    ("15", "A0710", "Plumbing Trim & Fixtures",      [("A0630", "FS", 0)],                     False),
-    ("16", "A0720", "Electrical Trim & Devices",     [("A0640", "FS", 0)],                     False),
-    ("16", "A0730", "Fire Alarm Trim & Test",        [("A0620", "FS", 0)],                     False),
-    ("16", "A0740", "Low Voltage Trim & Test",       [("A0620", "FS", 0)],                     False),
+    ("15", "A0700", "HVAC Trim & Startup",           (("A0620", "FS", 0),),                   False),
+    ("15", "A0710", "Plumbing Trim & Fixtures",      (("A0630", "FS", 0),),                   False),
+    ("16", "A0720", "Electrical Trim & Devices",     (("A0640", "FS", 0),),                   False),
+    ("16", "A0730", "Fire Alarm Trim & Test",        (("A0620", "FS", 0),),                   False),
+    ("16", "A0740", "Low Voltage Trim & Test",       (("A0620", "FS", 0),),                   False),
 
     # ── Commissioning & Closeout ──────────────────────────
-    ("01", "A0800", "Test & Balance",                [("A0700", "FS", 0)],                     False),
-    ("01", "A0810", "Commissioning",                 [("A0800", "FS", 0)],                     False),
-    ("01", "A0820", "Punch List",                    [("A0810", "FS", 0), ("A0710", "FS", 0), ("A0720", "FS", 0)], False),
-    ("01", "A0830", "Final Inspections",             [("A0820", "FS", 0)],                     True),
-    ("01", "A0840", "Certificate of Occupancy",      [("A0830", "FS", 0)],                     True),
-    ("01", "A0850", "Substantial Completion",        [("A0840", "FS", 0)],                     True),
+    ("01", "A0800", "Test & Balance",                (("A0700", "FS", 0),),                   False),
+    ("01", "A0810", "Commissioning",                 (("A0800", "FS", 0),),                   False),
+    ("01", "A0820", "Punch List",                    (("A0810", "FS", 0), ("A0710", "FS", 0), ("A0720", "FS", 0)), False),
+    ("01", "A0830", "Final Inspections",             (("A0820", "FS", 0),),                   True),
+    ("01", "A0840", "Certificate of Occupancy",      (("A0830", "FS", 0),),                   True),
+    ("01", "A0850", "Substantial Completion",        (("A0840", "FS", 0),),                   True),
 ]
 
 
@@ -90,63 +96,63 @@ _NEW_CONSTRUCTION = [
 # ═══════════════════════════════════════════════════════════════
 _RENOVATION = [
     # ── Preconstruction ───────────────────────────────────
-    ("01", "R0010", "Notice to Proceed",             [],                                        True),
-    ("01", "R0020", "Permits & Approvals",           [("R0010", "FS", 0)],                     True),
-    ("01", "R0030", "Shop Drawing Submittals",       [("R0010", "FS", 0)],                     False),
-    ("01", "R0040", "Material Procurement",          [("R0030", "FS", 5)],                     False),
-    ("01", "R0050", "Existing Conditions Survey",    [("R0010", "FS", 0)],                     False),
+    ("01", "R0010", "Notice to Proceed",             (),                                        True),
+    ("01", "R0020", "Permits & Approvals",           (("R0010", "FS", 0),),                   True),
+    ("01", "R0030", "Shop Drawing Submittals",       (("R0010", "FS", 0),),                   False),
+    ("01", "R0040", "Material Procurement",          (("R0030", "FS", 5),),                   False),
+    ("01", "R0050", "Existing Conditions Survey",    (("R0010", "FS", 0),),                   False),
 
     # ── Mobilization & Protection ─────────────────────────
-    ("02", "R0100", "Mobilization",                  [("R0020", "FS", 0)],                     False),
-    ("02", "R0110", "Temp Barriers & Dust Control",  [("R0100", "FS", 0)],                     False),
-    ("02", "R0120", "Tenant Protection / Phasing",   [("R0100", "FS", 0)],                     False),
+    ("02", "R0100", "Mobilization",                  (("R0020", "FS", 0),),                   False),
+    ("02", "R0110", "Temp Barriers & Dust Control",  (("R0100", "FS", 0),),                   False),
+    ("02", "R0120", "Tenant Protection / Phasing",   (("R0100", "FS", 0),),                   False),
 
     # ── Abatement & Demolition ────────────────────────────
-    ("02", "R0200", "Hazmat Abatement",              [("R0110", "FS", 0)],                     False),
-    ("02", "R0210", "Selective Interior Demo",       [("R0200", "FS", 0)],                     False),
-    ("02", "R0220", "MEP Demo & Cap-Off",            [("R0200", "FS", 0)],                     False),
-    ("02", "R0230", "Demo Debris Removal",           [("R0210", "SS", 3)],                     False),
+    ("02", "R0200", "Hazmat Abatement",              (("R0110", "FS", 0),),                   False),
+    ("02", "R0210", "Selective Interior Demo",       (("R0200", "FS", 0),),                   False),
+    ("02", "R0220", "MEP Demo & Cap-Off",            (("R0200", "FS", 0),),                   False),
+    ("02", "R0230", "Demo Debris Removal",           (("R0210", "SS", 3),),                   False),
 
     # ── Structural Modifications ──────────────────────────
-    ("05", "R0300", "Structural Modifications",      [("R0210", "FS", 0), ("R0050", "FS", 0)], False),
-    ("03", "R0310", "Concrete Repairs & Patching",   [("R0300", "FS", 0)],                     False),
+    ("05", "R0300", "Structural Modifications",      (("R0210", "FS", 0), ("R0050", "FS", 0)), False),
+    ("03", "R0310", "Concrete Repairs & Patching",   (("R0300", "FS", 0),),                   False),
 
     # ── Envelope Repairs (if needed) ──────────────────────
-    ("07", "R0400", "Roof Repairs / Replacement",    [("R0210", "FS", 0)],                     False),
-    ("07", "R0410", "Exterior Wall Repairs",         [("R0210", "FS", 0)],                     False),
-    ("08", "R0420", "Window Replacement",            [("R0410", "SS", 5)],                     False),
-    ("07", "R0430", "Waterproofing Repairs",         [("R0410", "SS", 10)],                    False),
+    ("07", "R0400", "Roof Repairs / Replacement",    (("R0210", "FS", 0),),                   False),
+    ("07", "R0410", "Exterior Wall Repairs",         (("R0210", "FS", 0),),                   False),
+    ("08", "R0420", "Window Replacement",            (("R0410", "SS", 5),),                   False),
+    ("07", "R0430", "Waterproofing Repairs",         (("R0410", "SS", 10),),                  False),
 
     # ── MEP Rough-In ──────────────────────────────────────
-    ("15", "R0500", "HVAC Rough-In",                 [("R0310", "FS", 0), ("R0220", "FS", 0)], False),
-    ("15", "R0510", "Plumbing Rough-In",             [("R0220", "FS", 0)],                     False),
-    ("16", "R0520", "Electrical Rough-In",           [("R0310", "FS", 0), ("R0220", "FS", 0)], False),
-    ("15", "R0530", "Fire Protection",               [("R0310", "FS", 0)],                     False),
-    ("16", "R0540", "Fire Alarm Rough-In",           [("R0520", "SS", 5)],                     False),
-    ("16", "R0550", "Low Voltage Rough-In",          [("R0520", "SS", 5)],                     False),
+    ("15", "R0500", "HVAC Rough-In",                 (("R0310", "FS", 0), ("R0220", "FS", 0)), False),
+    ("15", "R0510", "Plumbing Rough-In",             (("R0220", "FS", 0),),                   False),
+    ("16", "R0520", "Electrical Rough-In",           (("R0310", "FS", 0), ("R0220", "FS", 0)), False),
+    ("15", "R0530", "Fire Protection",               (("R0310", "FS", 0),),                   False),
+    ("16", "R0540", "Fire Alarm Rough-In",           (("R0520", "SS", 5),),                   False),
+    ("16", "R0550", "Low Voltage Rough-In",          (("R0520", "SS", 5),),                   False),
 
     # ── Interior Finishes ─────────────────────────────────
-    ("09", "R0600", "Metal Framing & Drywall",       [("R0500", "SS", 10), ("R0520", "SS", 10)], False),
-    ("08", "R0610", "Doors & Hardware",              [("R0600", "SS", 15)],                    False),
-    ("09", "R0620", "Ceiling Grid & Tile",           [("R0600", "FS", 0)],                     False),
-    ("09", "R0630", "Flooring",                      [("R0600", "FS", 0)],                     False),
-    ("09", "R0640", "Painting",                      [("R0600", "FS", 0)],                     False),
-    ("10", "R0650", "Specialties & Accessories",     [("R0640", "FS", 0)],                     False),
+    ("09", "R0600", "Metal Framing & Drywall",       (("R0500", "SS", 10), ("R0520", "SS", 10)), False),
+    ("08", "R0610", "Doors & Hardware",              (("R0600", "SS", 15),),                  False),
+    ("09", "R0620", "Ceiling Grid & Tile",           (("R0600", "FS", 0),),                   False),
+    ("09", "R0630", "Flooring",                      (("R0600", "FS", 0),),                   False),
+    ("09", "R0640", "Painting",                      (("R0600", "FS", 0),),                   False),
+    ("10", "R0650", "Specialties & Accessories",     (("R0640", "FS", 0),),                   False),
 
     # ── MEP Trim ──────────────────────────────────────────
-    ("15", "R0700", "HVAC Trim & Startup",           [("R0620", "FS", 0)],                     False),
-    ("15", "R0710", "Plumbing Trim & Fixtures",      [("R0630", "FS", 0)],                     False),
-    ("16", "R0720", "Electrical Trim & Devices",     [("R0640", "FS", 0)],                     False),
-    ("16", "R0730", "Fire Alarm Trim & Test",        [("R0620", "FS", 0)],                     False),
-    ("16", "R0740", "Low Voltage Trim & Test",       [("R0620", "FS", 0)],                     False),
+    ("15", "R0700", "HVAC Trim & Startup",           (("R0620", "FS", 0),),                   False),
+    ("15", "R0710", "Plumbing Trim & Fixtures",      (("R0630", "FS", 0),),                   False),
+    ("16", "R0720", "Electrical Trim & Devices",     (("R0640", "FS", 0),),                   False),
+    ("16", "R0730", "Fire Alarm Trim & Test",        (("R0620", "FS", 0),),                   False),
+    ("16", "R0740", "Low Voltage Trim & Test",       (("R0620", "FS", 0),),                   False),
 
     # ── Closeout ──────────────────────────────────────────
-    ("01", "R0800", "Test & Balance",                [("R0700", "FS", 0)],                     False),
-    ("01", "R0810", "Commissioning",                 [("R0800", "FS", 0)],                     False),
-    ("01", "R0820", "Punch List",                    [("R0810", "FS", 0), ("R0710", "FS", 0), ("R0720", "FS", 0)], False),
-    ("01", "R0830", "Final Inspections",             [("R0820", "FS", 0)],                     True),
-    ("01", "R0840", "Certificate of Occupancy",      [("R0830", "FS", 0)],                     True),
-    ("01", "R0850", "Substantial Completion",        [("R0840", "FS", 0)],                     True),
+    ("01", "R0800", "Test & Balance",                (("R0700", "FS", 0),),                   False),
+    ("01", "R0810", "Commissioning",                 (("R0800", "FS", 0),),                   False),
+    ("01", "R0820", "Punch List",                    (("R0810", "FS", 0), ("R0710", "FS", 0), ("R0720", "FS", 0)), False),
+    ("01", "R0830", "Final Inspections",             (("R0820", "FS", 0),),                   True),
+    ("01", "R0840", "Certificate of Occupancy",      (("R0830", "FS", 0),),                   True),
+    ("01", "R0850", "Substantial Completion",        (("R0840", "FS", 0),),                   True),
 ]
 
 
@@ -157,45 +163,45 @@ _RENOVATION = [
 # ═══════════════════════════════════════════════════════════════
 _TENANT_IMPROVEMENT = [
     # ── Preconstruction ───────────────────────────────────
-    ("01", "T0010", "Notice to Proceed",             [],                                        True),
-    ("01", "T0020", "Permits & Approvals",           [("T0010", "FS", 0)],                     True),
-    ("01", "T0030", "Shop Drawing Submittals",       [("T0010", "FS", 0)],                     False),
-    ("01", "T0040", "Material Procurement",          [("T0030", "FS", 5)],                     False),
+    ("01", "T0010", "Notice to Proceed",             (),                                        True),
+    ("01", "T0020", "Permits & Approvals",           (("T0010", "FS", 0),),                   True),
+    ("01", "T0030", "Shop Drawing Submittals",       (("T0010", "FS", 0),),                   False),
+    ("01", "T0040", "Material Procurement",          (("T0030", "FS", 5),),                   False),
 
     # ── Mobilization & Demo ───────────────────────────────
-    ("02", "T0100", "Mobilization & Protection",     [("T0020", "FS", 0)],                     False),
-    ("02", "T0110", "Selective Demo",                [("T0100", "FS", 0)],                     False),
-    ("02", "T0120", "Demo Debris Removal",           [("T0110", "SS", 2)],                     False),
+    ("02", "T0100", "Mobilization & Protection",     (("T0020", "FS", 0),),                   False),
+    ("02", "T0110", "Selective Demo",                (("T0100", "FS", 0),),                   False),
+    ("02", "T0120", "Demo Debris Removal",           (("T0110", "SS", 2),),                   False),
 
     # ── MEP Rough-In ──────────────────────────────────────
-    ("15", "T0200", "HVAC Rough-In",                 [("T0110", "FS", 0)],                     False),
-    ("15", "T0210", "Plumbing Rough-In",             [("T0110", "FS", 0)],                     False),
-    ("16", "T0220", "Electrical Rough-In",           [("T0110", "FS", 0)],                     False),
-    ("15", "T0230", "Fire Protection Mods",          [("T0110", "FS", 0)],                     False),
-    ("16", "T0240", "Fire Alarm Rough-In",           [("T0220", "SS", 3)],                     False),
-    ("16", "T0250", "Low Voltage Rough-In",          [("T0220", "SS", 3)],                     False),
+    ("15", "T0200", "HVAC Rough-In",                 (("T0110", "FS", 0),),                   False),
+    ("15", "T0210", "Plumbing Rough-In",             (("T0110", "FS", 0),),                   False),
+    ("16", "T0220", "Electrical Rough-In",           (("T0110", "FS", 0),),                   False),
+    ("15", "T0230", "Fire Protection Mods",          (("T0110", "FS", 0),),                   False),
+    ("16", "T0240", "Fire Alarm Rough-In",           (("T0220", "SS", 3),),                   False),
+    ("16", "T0250", "Low Voltage Rough-In",          (("T0220", "SS", 3),),                   False),
 
     # ── Interior Finishes ─────────────────────────────────
-    ("09", "T0300", "Metal Framing & Drywall",       [("T0200", "SS", 5), ("T0220", "SS", 5)], False),
-    ("08", "T0310", "Doors & Hardware",              [("T0300", "SS", 10)],                    False),
-    ("09", "T0320", "Ceiling Grid & Tile",           [("T0300", "FS", 0)],                     False),
-    ("09", "T0330", "Flooring",                      [("T0300", "FS", 0)],                     False),
-    ("09", "T0340", "Painting",                      [("T0300", "FS", 0)],                     False),
-    ("10", "T0350", "Millwork & Casework",           [("T0340", "FS", 0)],                     False),
-    ("10", "T0360", "Specialties & Accessories",     [("T0340", "FS", 0)],                     False),
+    ("09", "T0300", "Metal Framing & Drywall",       (("T0200", "SS", 5), ("T0220", "SS", 5)), False),
+    ("08", "T0310", "Doors & Hardware",              (("T0300", "SS", 10),),                  False),
+    ("09", "T0320", "Ceiling Grid & Tile",           (("T0300", "FS", 0),),                   False),
+    ("09", "T0330", "Flooring",                      (("T0300", "FS", 0),),                   False),
+    ("09", "T0340", "Painting",                      (("T0300", "FS", 0),),                   False),
+    ("10", "T0350", "Millwork & Casework",           (("T0340", "FS", 0),),                   False),
+    ("10", "T0360", "Specialties & Accessories",     (("T0340", "FS", 0),),                   False),
 
     # ── MEP Trim ──────────────────────────────────────────
-    ("15", "T0400", "HVAC Trim & Startup",           [("T0320", "FS", 0)],                     False),
-    ("15", "T0410", "Plumbing Trim & Fixtures",      [("T0330", "FS", 0)],                     False),
-    ("16", "T0420", "Electrical Trim & Devices",     [("T0340", "FS", 0)],                     False),
-    ("16", "T0430", "Fire Alarm Trim & Test",        [("T0320", "FS", 0)],                     False),
-    ("16", "T0440", "Low Voltage Trim & Test",       [("T0320", "FS", 0)],                     False),
+    ("15", "T0400", "HVAC Trim & Startup",           (("T0320", "FS", 0),),                   False),
+    ("15", "T0410", "Plumbing Trim & Fixtures",      (("T0330", "FS", 0),),                   False),
+    ("16", "T0420", "Electrical Trim & Devices",     (("T0340", "FS", 0),),                   False),
+    ("16", "T0430", "Fire Alarm Trim & Test",        (("T0320", "FS", 0),),                   False),
+    ("16", "T0440", "Low Voltage Trim & Test",       (("T0320", "FS", 0),),                   False),
 
     # ── Closeout ──────────────────────────────────────────
-    ("01", "T0500", "Test & Balance",                [("T0400", "FS", 0)],                     False),
-    ("01", "T0510", "Punch List",                    [("T0500", "FS", 0), ("T0410", "FS", 0), ("T0420", "FS", 0)], False),
-    ("01", "T0520", "Final Inspection",              [("T0510", "FS", 0)],                     True),
-    ("01", "T0530", "Tenant Move-In Ready",          [("T0520", "FS", 0)],                     True),
+    ("01", "T0500", "Test & Balance",                (("T0400", "FS", 0),),                   False),
+    ("01", "T0510", "Punch List",                    (("T0500", "FS", 0), ("T0410", "FS", 0), ("T0420", "FS", 0)), False),
+    ("01", "T0520", "Final Inspection",              (("T0510", "FS", 0),),                   True),
+    ("01", "T0530", "Tenant Move-In Ready",          (("T0520", "FS", 0),),                   True),
 ]
 
 
@@ -219,7 +225,7 @@ _RATE_MAP = {
     "A0830": "FINAL_INSPECTION", "A0840": "CO_PROCESS",
 
     # Renovation (same rate codes, different activity IDs)
-    "R0100": "SITE_MOBILIZATION",
+    "R0050": "EXISTING_SURVEY", "R0100": "SITE_MOBILIZATION",
     "R0110": "TEMP_BARRIERS", "R0120": "TENANT_PROTECTION",
     "R0200": "HAZMAT_ABATEMENT", "R0210": "SELECTIVE_DEMO", "R0220": "MEP_DEMO", "R0230": "DEMO_REMOVAL",
     "R0300": "STRUCTURAL_MODS", "R0310": "CONCRETE_REPAIRS",
@@ -287,52 +293,171 @@ _RENO_PENALTY_CODES = {
     "R0700", "R0710", "R0720", "R0730", "R0740",
 }
 
+# Per-code duration flags, resolved once so _calc_duration does a single
+# lookup instead of probing each set above
+_F_MILESTONE = 1
+_F_RENO_PENALTY = 2
+_F_RENO_FIXED = 4
+_F_RENO_RATE = 8
+
+_CODE_FLAGS: dict[str, int] = {}
+for _code in _MILESTONES:
+    _CODE_FLAGS[_code] = _CODE_FLAGS.get(_code, 0) | _F_MILESTONE
+for _code in _RENO_PENALTY_CODES:
+    _CODE_FLAGS[_code] = _CODE_FLAGS.get(_code, 0) | _F_RENO_PENALTY
+for _code, _rate_code in _RATE_MAP.items():
+    if _RENO_FIXED.get(_rate_code) is not None:
+        _CODE_FLAGS[_code] = _CODE_FLAGS.get(_code, 0) | _F_RENO_FIXED
+    if _rate_code in _RENO_RATES:
+        _CODE_FLAGS[_code] = _CODE_FLAGS.get(_code, 0) | _F_RENO_RATE
+del _code, _rate_code
+
 # Valid project scope values
 VALID_SCOPES = ["new_construction", "renovation", "tenant_improvement"]
 
 
-def _get_template(scope: str) -> list:
-    """Return the activity template for the given scope."""
-    if scope == "renovation":
-        return _RENOVATION
-    elif scope == "tenant_improvement":
-        return _TENANT_IMPROVEMENT
-    else:
-        return _NEW_CONSTRUCTION
+# One shared read-only link per distinct (code, rel, lag) across all
+# templates; build_activities() hands out mutable copies
+_PREDS_INTERNED: dict[tuple, MappingProxyType] = {}
+
+
+def _intern_pred(pred_code: str, rel_type: str, lag: int) -> MappingProxyType:
+    key = (pred_code, rel_type, lag)
+    pred = _PREDS_INTERNED.get(key)
+    if pred is None:
+        pred = _PREDS_INTERNED[key] = MappingProxyType({
+            "activity_id": sys.intern(pred_code), "rel_type": sys.intern(rel_type), "lag": lag,
+        })
+    return pred
+
+
+def _to_columns(template: list) -> tuple[tuple, ...]:
+    """
+    Split a template into parallel column tuples:
+    (wbs, codes, names, is_ms, preds, fixed_ms, story_scaled).
+
+    Predecessor links are built here once and shared by every build;
+    build_activities() gives each Activity its own copies, since CPM and
+    predecessor_logic may edit them. fixed_ms / story_scaled
+    are the _MILESTONES / _STORY_SCALE memberships resolved per row.
+    """
+    wbs, codes, names, pred_defs, is_ms = zip(*template)
+    # Interned so the ~10 WBS codes / repeated names are single shared objects
+    wbs = tuple(map(sys.intern, wbs))
+    codes = tuple(map(sys.intern, codes))
+    names = tuple(map(sys.intern, names))
+    preds = tuple(tuple(_intern_pred(*pred) for pred in defs) for defs in pred_defs)
+    fixed_ms = tuple(code in _MILESTONES for code in codes)
+    story_scaled = tuple(code in _STORY_SCALE for code in codes)
+    return wbs, codes, names, is_ms, preds, fixed_ms, story_scaled
+
+
+_TEMPLATE_CACHE = {
+    "new_construction": _to_columns(_NEW_CONSTRUCTION),
+    "renovation": _to_columns(_RENOVATION),
+    "tenant_improvement": _to_columns(_TENANT_IMPROVEMENT),
+}
+
+
+# Column-form template for a scope; build_activities() validates the scope first
+_get_template = _TEMPLATE_CACHE.__getitem__
+
+
+def _validate_template(scope: str, columns: tuple[tuple, ...]) -> None:
+    """Fail fast on duplicate codes or links to codes outside the template."""
+    codes, preds = columns[1], columns[4]
+    code_set = set(codes)
+    if len(code_set) != len(codes):
+        raise ValueError(f"Duplicate activity codes in {scope} template")
+    for code, links in zip(codes, preds):
+        for pred in links:
+            if pred["activity_id"] not in code_set:
+                raise ValueError(
+                    f"{scope} template: {code} depends on unknown activity {pred['activity_id']}"
+                )
+            if pred["rel_type"] not in ("FS", "SS", "FF"):
+                raise ValueError(f"{scope} template: {code} has bad relationship {pred['rel_type']}")
+
+
+def _topo_order(columns: tuple[tuple, ...]) -> tuple[str, ...]:
+    """Kahn's algorithm over a template's predecessor links."""
+    codes, preds = columns[1], columns[4]
+    successors: dict[str, list[str]] = {code: [] for code in codes}
+    in_degree = dict.fromkeys(codes, 0)
+    for code, links in zip(codes, preds):
+        for pred in links:
+            successors[pred["activity_id"]].append(code)
+            in_degree[code] += 1
+
+    queue = deque(code for code in codes if in_degree[code] == 0)
+    order = []
+    while queue:
+        code = queue.popleft()
+        order.append(code)
+        for succ in successors[code]:
+            in_degree[succ] -= 1
+            if in_degree[succ] == 0:
+                queue.append(succ)
+
+    if len(order) != len(codes):
+        raise ValueError("Activity template contains a dependency cycle")
+    return tuple(order)
+
+
+# Templates are constant — validate them once here (links, then cycles in
+# _topo_order) instead of trusting them on every build
+for _scope, _columns in _TEMPLATE_CACHE.items():
+    _validate_template(_scope, _columns)
+del _scope, _columns
+
+# Template DAGs are constant, so their CPM evaluation order is too
+_TOPO_ORDER = {scope: _topo_order(columns) for scope, columns in _TEMPLATE_CACHE.items()}
 
 
+_RATE_CODES = frozenset(_RATE_MAP.values())
+
+
+@lru_cache(maxsize=256)
+def _rate_durations(building_type: str, square_feet: int) -> dict[str, int]:
+    """Standard durations for every mapped rate code, resolved in one batch."""
+    return get_durations_bulk(_RATE_CODES, building_type, square_feet)
+
+
+@lru_cache(maxsize=4096)
 def _calc_duration(code: str, building_type: str, square_feet: int, scope: str) -> int:
-    """Calculate duration for a single activity."""
+    """
+    Calculate duration for a single activity.
+
+    Cached independently of _build_specs so builds that differ only in
+    stories reuse the same per-activity durations.
+    """
+    flags = _CODE_FLAGS.get(code, 0)
+    rate_code = _RATE_MAP.get(code, "")
+
     # Check milestones first
-    if code in _MILESTONES:
-        rate_code = _RATE_MAP.get(code)
+    if flags & _F_MILESTONE:
         if rate_code and rate_code in FIXED_DURATIONS:
             return FIXED_DURATIONS[rate_code]
         return 0
 
     # Reno-specific fixed durations
-    rate_code = _RATE_MAP.get(code, "")
-    if rate_code in _RENO_FIXED and _RENO_FIXED[rate_code] is not None:
+    if flags & _F_RENO_FIXED:
         return _RENO_FIXED[rate_code]
 
     # Reno-specific per-SF rates
-    if rate_code in _RENO_RATES:
+    if flags & _F_RENO_RATE:
         return max(2, round(_RENO_RATES[rate_code] * (square_feet / 1000)))
 
-    # Existing conditions survey
-    if code == "R0050":
-        return 5
-
     # Standard rate lookup
     if rate_code:
-        dur = get_duration(rate_code, building_type, square_feet)
+        dur = _rate_durations(building_type, square_feet)[rate_code]
 
         # TI work is faster — 80% of new construction duration
         if scope == "tenant_improvement" and dur > 2:
-            dur = max(2, round(dur * 0.80))
+            dur = max(2, (dur * 4 + 2) // 5)  # round(dur * 0.80), integer-only
 
         # Renovation penalty — 15% slower for MEP/finishes in existing building
-        if scope == "renovation" and code in _RENO_PENALTY_CODES:
+        if scope == "renovation" and flags & _F_RENO_PENALTY:
             dur = round(dur * 1.15)
 
         return dur
@@ -340,6 +465,78 @@ def _calc_duration(code: str, building_type: str, square_feet: int, scope: str)
     return 5  # fallback
 
 
+@lru_cache(maxsize=256)
+def _build_specs(
+    building_type: str, square_feet: int, stories: int, scope: str,
+) -> tuple[tuple, ...]:
+    """
+    Resolve (code, name, wbs, duration, preds, is_milestone) for every
+    template activity. Cached on the inputs and shared between calls, so the
+    predecessor links in a spec are template-owned — build_activities()
+    copies them into each Activity it returns.
+    """
+    # +40% per story above the first, as an exact 5ths ratio: (5 + 2*(s-1)) / 5
+    story_num = 5 + 2 * (stories - 1)
+    specs = []
+    for wbs, code, name, is_ms, preds, fixed_ms, story_scaled in zip(*_get_template(scope)):
+        duration = _calc_duration(code, building_type, square_feet, scope)
+
+        # Scale by stories for structure and MEP
+        if story_scaled and stories > 1:
+            duration = duration * story_num // 5
+
+        specs.append((
+            code, name, wbs, duration, preds,
+            fixed_ms or (is_ms and duration == 0),
+        ))
+    return tuple(specs)
+
+
+def get_topo_order(scope: str = "new_construction") -> tuple[str, ...]:
+    """
+    Precomputed topological order of a scope's template activities.
+
+    Pass to compute_cpm(order=...) for activities from build_activities()
+    with the same scope to skip the per-run sort.
+    """
+    if scope not in VALID_SCOPES:
+        scope = "new_construction"
+    return _TOPO_ORDER[scope]
+
+
+# Relationship type codes used in get_edges()
+_REL_TYPE_CODES = {"FS": 0, "SS": 1, "FF": 2}
+
+
+@lru_cache(maxsize=None)
+def get_edges(scope: str = "new_construction"):
+    """
+    Predecessor links of a scope's template as an int32 array of shape (E, 4):
+    (from_idx, to_idx, rel_type_code, lag), where indexes follow template order
+    and rel_type_code is 0=FS, 1=SS, 2=FF.
+
+    Built on first use so numpy is only imported by callers that need it.
+    The returned array is read-only.
+    """
+    import numpy as np
+
+    if scope not in VALID_SCOPES:
+        scope = "new_construction"
+    columns = _get_template(scope)
+    codes, preds = columns[1], columns[4]
+    index = {code: i for i, code in enumerate(codes)}
+    edges = np.asarray(
+        [
+            (index[pred["activity_id"]], to_idx, _REL_TYPE_CODES[pred["rel_type"]], pred["lag"])
+            for to_idx, links in enumerate(preds)
+            for pred in links
+        ],
+        dtype=np.int32,
+    ).reshape(-1, 4)
+    edges.flags.writeable = False
+    return edges
+
+
 def build_activities(
     building_type: str = "office",
     square_feet: int = 50000,
@@ -358,37 +555,68 @@ def build_activities(
     if scope not in VALID_SCOPES:
         scope = "new_construction"
 
-    template = _get_template(scope)
-    activities = []
-
-    for wbs, code, name, pred_defs, is_ms in template:
-        duration = _calc_duration(code, building_type, square_feet, scope)
+    # Spec order matches Activity's leading fields (id, name, wbs, duration,
+    # predecessors); only is_milestone is passed by keyword. Links are
+    # copied per build so edits to one schedule can't reach the template.
+    activities = [
+        Activity(code, name, wbs, duration, [dict(p) for p in preds], is_milestone=is_milestone)
+        for code, name, wbs, duration, preds, is_milestone
+        in _build_specs(building_type, square_feet, stories, scope)
+    ]
 
-        # Scale by stories for structure and MEP
-        if stories > 1 and code in _STORY_SCALE:
-            duration = int(duration * (1 + 0.4 * (stories - 1)))
-
-        # Build predecessor list
-        preds = []
-        for pred_code, rel_type, lag in pred_defs:
-            preds.append({
-                "activity_id": pred_code,
-                "rel_type": rel_type,
-                "lag": lag,
-            })
-
-        act = Activity(
-            activity_id=code,
-            activity_name=name,
-            wbs=wbs,
-            duration=duration,
-            predecessors=preds,
-            is_milestone=code in _MILESTONES or (is_ms and duration == 0),
-        )
-        activities.append(act)
-
-    log.info(
+    log.debug(
         "Built %d activities for %s %s, %d SF, %d stories",
         len(activities), scope, building_type, square_feet, stories,
     )
     return activities
+
+
+def build_activities_columns(
+    building_type: str = "office",
+    square_feet: int = 50000,
+    stories: int = 2,
+    scope: str = "new_construction",
+) -> tuple[dict[str, tuple], tuple[tuple, ...]]:
+    """
+    Columnar form of build_activities() for bulk analytics.
+
+    Returns (columns, edges): columns maps activity_id / activity_name / wbs /
+    duration / is_milestone to parallel tuples (ready for pd.DataFrame), and
+    edges is a (from_id, to_id, rel_type, lag) table of predecessor links.
+    No Activity objects are allocated.
+    """
+    if scope not in VALID_SCOPES:
+        scope = "new_construction"
+
+    specs = _build_specs(building_type, square_feet, stories, scope)
+    codes, names, wbs, durations, preds, is_milestone = zip(*specs)
+    columns = {
+        "activity_id": codes,
+        "activity_name": names,
+        "wbs": wbs,
+        "duration": durations,
+        "is_milestone": is_milestone,
+    }
+    edges = tuple(
+        (pred["activity_id"], code, pred["rel_type"], pred["lag"])
+        for code, links in zip(codes, preds)
+        for pred in links
+    )
+    return columns, edges
+
+
+@lru_cache(maxsize=128)
+def build_activities_json(
+    building_type: str = "office",
+    square_feet: int = 50000,
+    stories: int = 2,
+    scope: str = "new_construction",
+) -> str:
+    """
+    build_activities() serialized as a JSON array of Activity.to_dict().
+
+    Cached on the inputs — the string is immutable, so repeated export
+    requests for the same project parameters skip the rebuild entirely.
+    """
+    return json.dumps([a.to_dict() for a in build_activities(building_type, square_feet, stories, scope)])
+
@@ -12,15 +12,18 @@ Supports relationship types: FS, SS, FF with lags.
 """
 from __future__ import annotations
 
+from collections import deque
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
+from operator import attrgetter
 
 from utils.logger import get_logger
 
 log = get_logger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class Activity:
     activity_id: str
     activity_name: str
@@ -37,77 +40,137 @@ class Activity:
     is_milestone: bool = False
 
     def to_dict(self) -> dict:
-        return {
-            "activity_id": self.activity_id,
-            "activity_name": self.activity_name,
-            "wbs": self.wbs,
-            "duration": self.duration,
-            "predecessors": self.predecessors,
-            "early_start": self.early_start,
-            "early_finish": self.early_finish,
-            "late_start": self.late_start,
-            "late_finish": self.late_finish,
-            "total_float": self.total_float,
-            "is_critical": self.is_critical,
-            "is_milestone": self.is_milestone,
-        }
-
-
-def compute_cpm(activities: list[Activity]) -> list[Activity]:
+        return dict(zip(_EXPORT_FIELDS, _export_values(self)))
+
+
+# Fields serialized by Activity.to_dict(), in output order (successors are
+# derived by compute_cpm and left out)
+_EXPORT_FIELDS = (
+    "activity_id", "activity_name", "wbs", "duration", "predecessors",
+    "early_start", "early_finish", "late_start", "late_finish",
+    "total_float", "is_critical", "is_milestone",
+)
+_export_values = attrgetter(*_EXPORT_FIELDS)
+
+
+# Relationship type -> small int code used inside the CPM passes; the
+# predecessor dicts themselves keep the "FS"/"SS"/"FF"/"SF" strings
+REL_FS, REL_SS, REL_FF, REL_SF = range(4)
+_REL_CODES = {"FS": REL_FS, "SS": REL_SS, "FF": REL_FF, "SF": REL_SF}
+
+
+class CycleDetected(ValueError):
+    """Raised by compute_cpm when predecessor links form a cycle."""
+
+
+@dataclass(slots=True)
+class ScheduleGraph:
+    """
+    Activity lookup and link indexes for one schedule, built once and shared
+    by validate_predecessors, detect_cycles and compute_cpm.
+    """
+    act_map: dict[str, Activity]
+    preds_by_id: dict[str, list[str]]                   # predecessor ids as listed
+    links_by_id: dict[str, list[tuple[str, int, int]]]  # in-schedule (pred, rel code, lag)
+    succs_by_id: dict[str, list[str]]                   # in-schedule successors, deduped
+    edge_map: dict[tuple[str, str], tuple[int, int]]    # (pred, succ) -> first (rel code, lag)
+
+
+def build_schedule_graph(activities: list[Activity]) -> ScheduleGraph:
+    """Index activities and their predecessor links in a single pass."""
+    act_map = {a.activity_id: a for a in activities}
+    preds_by_id: dict[str, list[str]] = {}
+    links_by_id: dict[str, list[tuple[str, int, int]]] = {}
+    succs_by_id: dict[str, list[str]] = {}
+    edge_map: dict[tuple[str, str], tuple[int, int]] = {}
+    for act in activities:
+        pred_ids = preds_by_id[act.activity_id] = []
+        links = links_by_id[act.activity_id] = []
+        for pred in act.predecessors:
+            pid = pred["activity_id"]
+            pred_ids.append(pid)
+            # Unknown types fall back to FS, as the passes always have
+            rel = _REL_CODES.get(pred.get("rel_type", "FS"), REL_FS)
+            lag = pred.get("lag", 0)
+            if pid in act_map:
+                links.append((pid, rel, lag))
+            key = (pid, act.activity_id)
+            if key in edge_map:
+                continue
+            edge_map[key] = (rel, lag)
+            if pid in act_map:
+                succs_by_id.setdefault(pid, []).append(act.activity_id)
+    return ScheduleGraph(act_map, preds_by_id, links_by_id, succs_by_id, edge_map)
+
+
+def compute_cpm(
+    activities: list[Activity],
+    order: Sequence[str] | None = None,
+    graph: ScheduleGraph | None = None,
+    stats: dict | None = None,
+) -> list[Activity]:
     """
     Run CPM forward and backward pass on a list of activities.
 
     Activities must have activity_id, duration, and predecessors set.
-    Modifies activities in place and returns them.
+    Modifies activities in place and returns them. Raises CycleDetected if
+    the predecessor links contain a cycle.
+
+    ``order`` is an optional precomputed topological order covering every
+    activity (e.g. activity_builder.get_topo_order); when given, the
+    internal sort and its cycle check are skipped. ``graph`` reuses indexes
+    already built by build_schedule_graph() for these activities. If a
+    ``stats`` dict is passed, project_finish and critical_count are stored
+    in it so callers need not rescan the activities.
     """
     if not activities:
         return activities
 
-    # Build lookup
-    act_map = {a.activity_id: a for a in activities}
-
-    # Build successor lists
-    for act in activities:
-        for pred in act.predecessors:
-            pred_act = act_map.get(pred["activity_id"])
-            if pred_act and act.activity_id not in pred_act.successors:
-                pred_act.successors.append(act.activity_id)
+    if graph is None:
+        graph = build_schedule_graph(activities)
+    act_map = graph.act_map
+    links_by_id = graph.links_by_id
+    edge_map = graph.edge_map
+
+    # Build successor lists — graph.succs_by_id is already deduped; merge
+    # through an insertion-ordered dict in case successors were set before
+    for pred_id, succ_ids in graph.succs_by_id.items():
+        pred_act = act_map[pred_id]
+        if pred_act.successors:
+            pred_act.successors = list(dict.fromkeys([*pred_act.successors, *succ_ids]))
+        else:
+            pred_act.successors = list(succ_ids)
 
     # ── Forward Pass ──────────────────────────────────────
-    # Topological sort
-    order = _topological_sort(activities, act_map)
+    # Topological sort (doubles as the cycle check)
+    if order is None:
+        order, has_cycle = _topological_sort(activities, graph)
+        if has_cycle:
+            raise CycleDetected("Circular dependency detected in schedule")
 
+    project_finish = 0
     for act_id in order:
         act = act_map[act_id]
 
-        if not act.predecessors:
-            act.early_start = 0
-        else:
-            max_es = 0
-            for pred in act.predecessors:
-                pred_act = act_map.get(pred["activity_id"])
-                if not pred_act:
-                    continue
-                rel = pred.get("rel_type", "FS")
-                lag = pred.get("lag", 0)
-
-                if rel == "FS":
-                    es = pred_act.early_finish + lag
-                elif rel == "SS":
-                    es = pred_act.early_start + lag
-                elif rel == "FF":
-                    es = pred_act.early_finish + lag - act.duration
-                else:
-                    es = pred_act.early_finish + lag
-
-                max_es = max(max_es, es)
-
-            act.early_start = max_es
-
-        act.early_finish = act.early_start + act.duration
+        max_es = 0
+        for pred_id, rel, lag in links_by_id[act_id]:
+            pred_act = act_map[pred_id]
+            if rel == REL_SS:
+                es = pred_act.early_start + lag
+            elif rel == REL_FF:
+                es = pred_act.early_finish + lag - act.duration
+            else:                               # FS (and SF, treated as FS)
+                es = pred_act.early_finish + lag
+            if es > max_es:
+                max_es = es
+
+        act.early_start = max_es
+        act.early_finish = max_es + act.duration
+        if act.early_finish > project_finish:
+            project_finish = act.early_finish
 
     # ── Backward Pass ─────────────────────────────────────
-    project_finish = max(a.early_finish for a in activities)
+    critical_count = 0
 
     for act_id in reversed(order):
         act = act_map[act_id]
@@ -121,39 +184,117 @@ def compute_cpm(activities: list[Activity]) -> list[Activity]:
                 if not succ:
                     continue
 
-                # Find the predecessor entry in successor that references this activity
-                for pred in succ.predecessors:
-                    if pred["activity_id"] == act.activity_id:
-                        rel = pred.get("rel_type", "FS")
-                        lag = pred.get("lag", 0)
+                # The (first) link in the successor that references this activity
+                edge = edge_map.get((act.activity_id, succ_id))
+                if edge is None:
+                    continue
+                rel, lag = edge
 
-                        if rel == "FS":
-                            lf = succ.late_start - lag
-                        elif rel == "SS":
-                            lf = succ.late_start - lag + act.duration
-                        elif rel == "FF":
-                            lf = succ.late_finish - lag
-                        else:
-                            lf = succ.late_start - lag
+                if rel == REL_SS:
+                    lf = succ.late_start - lag + act.duration
+                elif rel == REL_FF:
+                    lf = succ.late_finish - lag
+                else:                           # FS (and SF, treated as FS)
+                    lf = succ.late_start - lag
 
-                        min_lf = min(min_lf, lf)
-                        break
+                min_lf = min(min_lf, lf)
 
             act.late_finish = min_lf
 
         act.late_start = act.late_finish - act.duration
         act.total_float = act.late_start - act.early_start
         act.is_critical = act.total_float == 0
+        critical_count += act.is_critical
 
-    critical_count = sum(1 for a in activities if a.is_critical)
     log.info(
         "CPM complete: %d activities, project duration %d days, %d critical",
         len(activities), project_finish, critical_count,
     )
+    if stats is not None:
+        stats["project_finish"] = project_finish
+        stats["critical_count"] = critical_count
 
     return activities
 
 
+def compute_cpm_arrays(duration, edges):
+    """
+    CPM forward and backward pass on columnar data with NumPy.
+
+    For callers that already hold schedules as arrays (e.g.
+    activity_builder.build_activities_columns + get_edges), with no
+    Activity objects involved.
+
+    Args:
+        duration: int array of shape (N,), working days per activity
+        edges: int array of shape (E, 4): (from_idx, to_idx, rel_type, lag),
+            rel_type 0=FS, 1=SS, 2=FF; indexes into ``duration``
+
+    Returns (early_start, early_finish, late_start, late_finish, total_float)
+    as int64 arrays. Each link constrains both passes. Raises ValueError if
+    the links contain a cycle.
+    """
+    import numpy as np
+
+    dur = np.asarray(duration, dtype=np.int64)
+    n = len(dur)
+    edges = np.asarray(edges, dtype=np.int64).reshape(-1, 4)
+    src, dst, rel, lag = edges.T
+    if n == 0:
+        empty = np.zeros(0, dtype=np.int64)
+        return empty, empty, empty, empty, empty
+
+    # Topological level = longest link chain ending at each activity,
+    # relaxed over all links until stable (one sweep per level)
+    level = np.zeros(n, dtype=np.int64)
+    for _ in range(n + 1):
+        prev = level.copy()
+        np.maximum.at(level, dst, level[src] + 1)
+        if np.array_equal(level, prev):
+            break
+    else:
+        raise ValueError("Schedule links contain a cycle")
+    depth = int(level.max()) + 1
+
+    # Group links by successor level (forward) / predecessor level
+    # (backward), and activities by level, so each level is a slice
+    levels = np.arange(depth + 1)
+    f = np.argsort(level[dst], kind="stable")
+    f_src, f_dst, f_rel, f_lag = src[f], dst[f], rel[f], lag[f]
+    f_bounds = np.searchsorted(level[f_dst], levels)
+    b = np.argsort(level[src], kind="stable")
+    b_src, b_dst, b_rel, b_lag = src[b], dst[b], rel[b], lag[b]
+    b_bounds = np.searchsorted(level[b_src], levels)
+    nodes = np.argsort(level, kind="stable")
+    n_bounds = np.searchsorted(level[nodes], levels)
+
+    # ── Forward Pass ──────────────────────────────────────
+    es = np.zeros(n, dtype=np.int64)
+    ef = dur.copy()
+    for lvl in range(1, depth):
+        sl = slice(f_bounds[lvl], f_bounds[lvl + 1])
+        s_, d_, r_ = f_src[sl], f_dst[sl], f_rel[sl]
+        cand = np.where(r_ == 1, es[s_], ef[s_]) + f_lag[sl]
+        cand -= np.where(r_ == 2, dur[d_], 0)
+        np.maximum.at(es, d_, cand)
+        at = nodes[n_bounds[lvl]:n_bounds[lvl + 1]]
+        ef[at] = es[at] + dur[at]
+
+    # ── Backward Pass ─────────────────────────────────────
+    lf = np.full(n, ef.max(), dtype=np.int64)
+    ls = lf - dur
+    for lvl in range(depth - 1, -1, -1):
+        sl = slice(b_bounds[lvl], b_bounds[lvl + 1])
+        s_, d_, r_ = b_src[sl], b_dst[sl], b_rel[sl]
+        cand = np.where(r_ == 2, lf[d_], ls[d_]) - b_lag[sl]
+        cand += np.where(r_ == 1, dur[s_], 0)
+        np.minimum.at(lf, s_, cand)
+        at = nodes[n_bounds[lvl]:n_bounds[lvl + 1]]
+        ls[at] = lf[at] - dur[at]
+
+    return es, ef, ls, lf, ls - es
+
+
 def get_critical_path(activities: list[Activity]) -> list[Activity]:
     """Return activities on the critical path, in order."""
     return [a for a in activities if a.is_critical]
@@ -174,43 +315,71 @@ def day_to_date(day_number: int, start_date: datetime, skip_weekends: bool = Tru
 def activities_to_export(
     activities: list[Activity],
     start_date: datetime | None = None,
+    max_day: int | None = None,
 ) -> list[dict]:
-    """Convert activities to export-ready dicts with calendar dates."""
+    """
+    Convert activities to export-ready dicts with calendar dates.
+
+    ``max_day`` is the latest working day used by any activity; after
+    compute_cpm that is the project finish, so callers holding it can
+    skip the scan here.
+    """
     start_date = start_date or datetime.now()
+    if not activities:
+        return []
+
+    # Working day -> formatted date, built once up to the latest day used
+    # (day_to_date semantics: day 0 is the start date, non-positive days
+    # clamp to it)
+    if max_day is None:
+        max_day = max(max(a.early_finish, a.late_finish, a.early_start, a.late_start) for a in activities)
+    dates = _working_day_dates(max(max_day, 0), start_date)
+
     result = []
     for act in activities:
         d = act.to_dict()
-        d["early_start"] = day_to_date(act.early_start, start_date).strftime("%Y-%m-%d")
-        d["early_finish"] = day_to_date(act.early_finish, start_date).strftime("%Y-%m-%d")
-        d["late_start"] = day_to_date(act.late_start, start_date).strftime("%Y-%m-%d")
-        d["late_finish"] = day_to_date(act.late_finish, start_date).strftime("%Y-%m-%d")
+        d["early_start"] = dates[max(act.early_start, 0)]
+        d["early_finish"] = dates[max(act.early_finish, 0)]
+        d["late_start"] = dates[max(act.late_start, 0)]
+        d["late_finish"] = dates[max(act.late_finish, 0)]
         result.append(d)
     return result
 
 
-def _topological_sort(activities: list[Activity], act_map: dict[str, Activity]) -> list[str]:
-    """Topological sort of activities by predecessor dependencies."""
+def _working_day_dates(max_day: int, start_date: datetime) -> list[str]:
+    """"%Y-%m-%d" strings for working days 0..max_day, weekends skipped."""
+    import numpy as np
+
+    # Rolling a weekend start back to Friday makes offset 1 the next
+    # Monday, as day_to_date counts it; day 0 stays the start date itself
+    later = np.busday_offset(
+        np.datetime64(start_date.date()), np.arange(1, max_day + 1), roll="backward",
+    )
+    return [start_date.strftime("%Y-%m-%d"), *np.datetime_as_string(later, unit="D").tolist()]
+
+
+def _topological_sort(activities: list[Activity], graph: ScheduleGraph) -> tuple[list[str], bool]:
+    """
+    Topological sort of activities by predecessor dependencies (Kahn's).
+
+    Returns (order, has_cycle). Activities on or behind a cycle never reach
+    in-degree zero, so they are missing from the order and has_cycle is True.
+    """
+    succs_by_id = graph.succs_by_id
     in_degree = {a.activity_id: 0 for a in activities}
-    for act in activities:
-        for pred in act.predecessors:
-            if pred["activity_id"] in act_map:
-                in_degree[act.activity_id] = in_degree.get(act.activity_id, 0) + 1
+    for succ_ids in succs_by_id.values():
+        for succ_id in succ_ids:
+            in_degree[succ_id] += 1
 
-    queue = [aid for aid, deg in in_degree.items() if deg == 0]
+    queue = deque(aid for aid, deg in in_degree.items() if deg == 0)
     order = []
 
     while queue:
-        current = queue.pop(0)
+        current = queue.popleft()
         order.append(current)
-        act = act_map[current]
-        for succ_id in act.successors:
+        for succ_id in succs_by_id.get(current, ()):
             in_degree[succ_id] -= 1
             if in_degree[succ_id] == 0:
                 queue.append(succ_id)
 
-    # Add any activities not reached (disconnected)
-    for act in activities:
-        if act.activity_id not in order:
-            order.append(act.activity_id)
-
-    return order
+    return order, len(order) < len(in_degree)
@@ -5,7 +5,7 @@ Helper functions for building and validating predecessor chains.
 """
 from __future__ import annotations
 
-from scheduling.cpm_engine import Activity
+from scheduling.cpm_engine import Activity, ScheduleGraph
 
 
 def add_predecessor(activity: Activity, pred_id: str, rel_type: str = "FS", lag: int = 0):
@@ -17,12 +17,17 @@ def add_predecessor(activity: Activity, pred_id: str, rel_type: str = "FS", lag:
     })
 
 
-def validate_predecessors(activities: list[Activity]) -> list[str]:
+def validate_predecessors(
+    activities: list[Activity],
+    graph: ScheduleGraph | None = None,
+) -> list[str]:
     """
     Validate predecessor references. Returns list of error messages.
+
+    ``graph`` reuses the activity index from cpm_engine.build_schedule_graph().
     """
     errors = []
-    act_ids = {a.activity_id for a in activities}
+    act_ids = graph.act_map if graph is not None else {a.activity_id for a in activities}
 
     for act in activities:
         for pred in act.predecessors:
@@ -37,31 +42,45 @@ def validate_predecessors(activities: list[Activity]) -> list[str]:
     return errors
 
 
-def detect_cycles(activities: list[Activity]) -> bool:
-    """Check for circular dependencies. Returns True if a cycle exists."""
-    act_map = {a.activity_id: a for a in activities}
+def detect_cycles(
+    activities: list[Activity],
+    graph: ScheduleGraph | None = None,
+) -> bool:
+    """
+    Check for circular dependencies. Returns True if a cycle exists.
+
+    ``graph`` reuses the predecessor index from cpm_engine.build_schedule_graph().
+    """
+    if graph is not None:
+        preds_by_id = graph.preds_by_id
+    else:
+        preds_by_id = {
+            a.activity_id: [pred["activity_id"] for pred in a.predecessors]
+            for a in activities
+        }
     visited = set()
     rec_stack = set()
 
-    def dfs(act_id: str) -> bool:
-        visited.add(act_id)
-        rec_stack.add(act_id)
-
-        act = act_map.get(act_id)
-        if act:
-            for pred in act.predecessors:
-                pid = pred["activity_id"]
-                if pid not in visited:
-                    if dfs(pid):
-                        return True
-                elif pid in rec_stack:
-                    return True
-
-        rec_stack.discard(act_id)
-        return False
-
+    # Iterative DFS over predecessor links — an explicit stack of
+    # (activity, remaining predecessors) so long chains can't hit the
+    # recursion limit
     for act in activities:
-        if act.activity_id not in visited:
-            if dfs(act.activity_id):
+        root = act.activity_id
+        if root in visited:
+            continue
+        visited.add(root)
+        rec_stack.add(root)
+        stack = [(root, iter(preds_by_id.get(root, ())))]
+        while stack:
+            act_id, preds = stack[-1]
+            pid = next(preds, None)
+            if pid is None:
+                stack.pop()
+                rec_stack.discard(act_id)
+            elif pid in rec_stack:
                 return True
+            elif pid not in visited:
+                visited.add(pid)
+                rec_stack.add(pid)
+                stack.append((pid, iter(preds_by_id.get(pid, ()))))
     return False
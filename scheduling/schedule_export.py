@@ -7,9 +7,12 @@ from __future__ import annotations
 from datetime import datetime
 from pathlib import Path
 
-from scheduling.activity_builder import build_activities
-from scheduling.cpm_engine import compute_cpm, activities_to_export, get_critical_path
-from scheduling.predecessor_logic import validate_predecessors, detect_cycles
+from scheduling.activity_builder import build_activities, get_topo_order
+from scheduling.cpm_engine import (
+    CycleDetected, activities_to_export, build_schedule_graph, compute_cpm,
+    get_critical_path,
+)
+from scheduling.predecessor_logic import validate_predecessors
 from scheduling.wbs_builder import build_wbs, wbs_to_text
 from output.schedule_excel import write_schedule_excel
 from utils.logger import get_logger
@@ -37,30 +40,33 @@ def generate_schedule(
     # 1. Build activities
     activities = build_activities(building_type, square_feet, stories, scope=scope)
 
-    # 2. Validate
-    errors = validate_predecessors(activities)
+    # 2. Validate — one activity/link index shared by validation and CPM
+    graph = build_schedule_graph(activities)
+    errors = validate_predecessors(activities, graph)
     if errors:
         for e in errors:
             log.error("Predecessor error: %s", e)
         return {"error": "Predecessor validation failed", "errors": errors}
 
-    has_cycle = detect_cycles(activities)
-    if has_cycle:
+    # 3. Run CPM — no separate detect_cycles pass: template orders are
+    # cycle-checked at import (activity_builder._topo_order) and
+    # compute_cpm's own sort raises CycleDetected
+    cpm_stats: dict = {}
+    try:
+        activities = compute_cpm(activities, order=get_topo_order(scope), graph=graph, stats=cpm_stats)
+    except CycleDetected:
         log.error("Circular dependency detected in schedule")
         return {"error": "Circular dependency detected"}
 
-    # 3. Run CPM
-    activities = compute_cpm(activities)
-
     # 4. Get critical path
     critical = get_critical_path(activities)
-    project_duration = max(a.early_finish for a in activities) if activities else 0
+    project_duration = cpm_stats.get("project_finish", 0)
 
     # 5. Build WBS
     wbs = build_wbs(activities, project_name)
 
     # 6. Export to Excel
-    export_data = activities_to_export(activities, start_date)
+    export_data = activities_to_export(activities, start_date, max_day=project_duration)
     excel_path = output_dir / f"{project_name.replace(' ', '_')}_Schedule.xlsx"
     write_schedule_excel(export_data, project_name, excel_path)
 
@@ -17,18 +17,20 @@ class WBSNode:
     level: int = 0
     activities: list[Activity] = field(default_factory=list)
     children: list["WBSNode"] = field(default_factory=list)
+    # Subtree rollups, filled in post-order by build_wbs()
+    total_duration: int = 0
+    activity_count: int = 0
 
-    @property
-    def total_duration(self) -> int:
-        own = sum(a.duration for a in self.activities)
-        child = sum(c.total_duration for c in self.children)
-        return own + child
 
-    @property
-    def activity_count(self) -> int:
-        own = len(self.activities)
-        child = sum(c.activity_count for c in self.children)
-        return own + child
+def _finalize(node: WBSNode) -> None:
+    """Compute subtree duration/count rollups bottom-up, once per node."""
+    for child in node.children:
+        _finalize(child)
+    node.total_duration = (
+        sum(a.duration for a in node.activities)
+        + sum(c.total_duration for c in node.children)
+    )
+    node.activity_count = len(node.activities) + sum(c.activity_count for c in node.children)
 
 
 # Division code → name mapping for WBS
@@ -63,28 +65,33 @@ def build_wbs(activities: list[Activity], project_name: str = "Project") -> WBSN
         by_div.setdefault(div, []).append(act)
 
     # Create division nodes
-    for div_code in sorted(by_div.keys()):
+    for div_code, div_acts in sorted(by_div.items()):
         div_name = _DIV_NAMES.get(div_code, f"Division {div_code}")
         node = WBSNode(
             code=div_code,
             name=div_name,
             level=1,
-            activities=by_div[div_code],
+            activities=div_acts,
         )
         root.children.append(node)
 
+    _finalize(root)
     return root
 
 
 def wbs_to_text(node: WBSNode, indent: int = 0) -> str:
     """Format WBS tree as indented text."""
     lines = []
-    prefix = "  " * indent
-    count = node.activity_count
-    dur = node.total_duration
-    lines.append(f"{prefix}{node.code} {node.name} ({count} activities, {dur} days)")
-    for act in node.activities:
-        lines.append(f"{prefix}  {act.activity_id} {act.activity_name} ({act.duration}d)")
-    for child in node.children:
-        lines.append(wbs_to_text(child, indent + 1))
+    # Pre-order walk with an explicit stack; children pushed in reverse so
+    # they pop in order. One flat line list, joined once at the end.
+    stack = [(node, indent)]
+    while stack:
+        node, indent = stack.pop()
+        prefix = "  " * indent
+        count = node.activity_count
+        dur = node.total_duration
+        lines.append(f"{prefix}{node.code} {node.name} ({count} activities, {dur} days)")
+        for act in node.activities:
+            lines.append(f"{prefix}  {act.activity_id} {act.activity_name} ({act.duration}d)")
+        stack.extend((child, indent + 1) for child in reversed(node.children))
     return "\n".join(lines)
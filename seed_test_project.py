@@ -7,6 +7,8 @@ so every dashboard tool has data to play with.
 """
 import sys
 import random
+import sqlite3
+from dataclasses import dataclass
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parent))
@@ -25,17 +27,35 @@ def seed():
         conn.close()
         return
 
-    # ── Project 1: McCrory Office Tower (original) ────────
-    pid1 = _seed_office_tower(conn)
+    # All three projects go in one transaction: one commit (one fsync),
+    # and a failure part-way leaves nothing behind. On SQLite take the
+    # write lock up front rather than upgrading on the first INSERT.
+    try:
+        if isinstance(conn, sqlite3.Connection):
+            conn.execute("BEGIN IMMEDIATE")
 
-    # ── Project 2: Southpark Medical Center ────────────────
-    pid2 = _seed_medical_center(conn)
+        # ── Project 1: McCrory Office Tower (original) ────────
+        pid1 = _seed_project(conn, OFFICE_TOWER)
 
-    # ── Project 3: Ballantyne Mixed-Use ────────────────────
-    pid3 = _seed_mixed_use(conn)
+        # ── Project 2: Southpark Medical Center ────────────────
+        pid2 = _seed_project(conn, MEDICAL_CENTER)
 
-    conn.commit()
-    conn.close()
+        # ── Project 3: Ballantyne Mixed-Use ────────────────────
+        pid3 = _seed_project(conn, MIXED_USE)
+
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+    # Project folders only once the rows are committed; the parent is
+    # created once, then one mkdir per project
+    projects_dir = Path(PROJECTS_DIR)
+    projects_dir.mkdir(parents=True, exist_ok=True)
+    for pid in (pid1, pid2, pid3):
+        (projects_dir / str(pid)).mkdir(exist_ok=True)
 
     print(f"\nDemo data seeded:")
     print(f"  1. McCrory Office Tower (ID #{pid1}) — 47 sheets, 10 disciplines")
@@ -45,25 +65,34 @@ def seed():
     print(f"  Plus: mock files, processing runs, feedback history\n")
 
 
-def _seed_office_tower(conn):
-    """Original 47-sheet commercial office project."""
-    cursor = conn.execute(
-        """INSERT INTO projects (name, building_type, square_feet, stories, notes)
-           VALUES (?, ?, ?, ?, ?)""",
-        (
-            "McCrory Office Tower",
-            "office",
-            85000,
-            4,
-            "4-story Class A office, structural steel frame, curtain wall envelope. "
-            "PM: Timmy McClure. McCrory Construction — Charlotte, NC.",
-        ),
-    )
-    pid = cursor.lastrowid
-    proj_dir = Path(PROJECTS_DIR) / str(pid)
-    proj_dir.mkdir(parents=True, exist_ok=True)
-
-    sheets = [
+@dataclass
+class ProjectSpec:
+    """One demo project: the projects row plus everything seeded under it."""
+    name: str
+    building_type: str
+    square_feet: int
+    stories: int
+    notes: str
+    sheets: list[tuple]                 # (sheet_id, sheet_name, discipline, page_number)
+    files: list[tuple]                  # (filename, file_type, page_count, status)
+    runs: list[tuple]                   # (run_type, files, sheets, conflicts, status, notes)
+    feedback: list[tuple]               # (conflict_id, action, original, adjusted, note)
+    markups: list[tuple]                # (sheet_id, type, label, content, author, color, page)
+    conf_range: tuple[float, float] = (0.85, 0.99)
+
+
+# Original 47-sheet commercial office project.
+OFFICE_TOWER = ProjectSpec(
+    name="McCrory Office Tower",
+    building_type="office",
+    square_feet=85000,
+    stories=4,
+    notes=(
+        "4-story Class A office, structural steel frame, curtain wall envelope. "
+        "PM: Timmy McClure. McCrory Construction — Charlotte, NC."
+    ),
+    conf_range=(0.88, 0.99),
+    sheets=[
         ("G-001", "Cover Sheet & Drawing Index", "GEN", 1),
         ("G-002", "General Notes & Abbreviations", "GEN", 2),
         ("C-101", "Site Plan & Grading", "CIV", 3),
@@ -111,37 +140,21 @@ def _seed_office_tower(conn):
         ("FA-201", "Fire Alarm Riser & Details", "FA", 45),
         ("T-101", "Telecom/Data Plan — Level 1", "TECH", 46),
         ("T-102", "Telecom/Data Plans — Levels 2-4", "TECH", 47),
-    ]
-
-    _insert_sheets(conn, pid, sheets, conf_range=(0.88, 0.99))
-
-    # Mock uploaded files
-    _insert_files(conn, pid, [
+    ],
+    files=[
         ("McCrory_Office_Tower_Arch.pdf", "drawing", 14, "processed"),
         ("McCrory_Office_Tower_Struct.pdf", "drawing", 8, "processed"),
         ("McCrory_Office_Tower_MEP.pdf", "drawing", 17, "processed"),
         ("McCrory_Office_Tower_FP_FA.pdf", "drawing", 6, "processed"),
         ("McCrory_Office_Tower_Civil.pdf", "drawing", 2, "processed"),
-    ])
-
-    # Processing runs
-    conn.execute(
-        """INSERT INTO processing_runs
-           (project_id, run_type, files_processed, sheets_found, status, notes)
-           VALUES (?, ?, ?, ?, ?, ?)""",
-        (pid, "ingestion", 5, 47, "complete",
+    ],
+    runs=[
+        ("ingestion", 5, 47, 0, "complete",
          "Full 47-sheet commercial office drawing set — 5 PDF packages"),
-    )
-    conn.execute(
-        """INSERT INTO processing_runs
-           (project_id, run_type, files_processed, sheets_found, conflicts_found, status, notes)
-           VALUES (?, ?, ?, ?, ?, ?, ?)""",
-        (pid, "review", 5, 47, 12, "complete",
+        ("review", 5, 47, 12, "complete",
          "Cross-discipline review — 12 conflicts detected across 8 rule categories"),
-    )
-
-    # Feedback history (makes the feedback/metrics page interesting)
-    _insert_feedback(conn, pid, [
+    ],
+    feedback=[
         ("CR-001", "confirm", "CRITICAL", "CRITICAL", "Beam depth conflict confirmed — 24\" W-beam vs 10' ceiling"),
         ("CR-005", "downgrade", "MAJOR", "MINOR", "Duct routing has clearance, just tight. Not a real conflict."),
         ("CR-008", "dismiss", "MINOR", "INFO", "Panel location works fine — field verified"),
@@ -149,10 +162,9 @@ def _seed_office_tower(conn):
         ("CR-003", "confirm", "CRITICAL", "CRITICAL", "Column grid offset confirmed between S-101 and A-101"),
         ("CR-015", "downgrade", "MAJOR", "MINOR", "Plumbing chase size adequate per plumber"),
         ("CR-022", "dismiss", "MINOR", "INFO", "Telecom pathway cleared with IT consultant"),
-    ])
-
+    ],
     # Bluebeam markups — what Timmy would add during plan review
-    _insert_markups(conn, pid, [
+    markups=[
         ("A-101", "callout", "RFI", "Door 101A swings into corridor — verify clearance with ADA path of travel", "Timmy McClure", "#ff0000", 5),
         ("A-101", "cloud", "VERIFY", "Column grid line offset 2\" between A-101 and S-101 — coordinate with structural", "Timmy McClure", "#ff6600", 5),
         ("A-102", "measurement", "DIM", "Ceiling height 9'-6\" — confirm plenum depth for 24\" ductwork + sprinkler main", "Timmy McClure", "#0066ff", 6),
@@ -168,31 +180,23 @@ def _seed_office_tower(conn):
         ("A-601", "callout", "RFI", "Door schedule shows HM frame for 101B but elevation shows aluminum storefront", "Timmy McClure", "#ff0000", 13),
         ("S-201", "stamp", "REVISE", "Connection detail SD-4 needs revision per steel fabricator RFI response", "Jake Reynolds", "#ff6600", 20),
         ("M-301", "callout", "SPEC", "VAV box schedule calls for Trane but spec section 23 36 00 says Carrier — which?", "Timmy McClure", "#ff0000", 27),
-    ])
-
-    return pid
-
-
-def _seed_medical_center(conn):
-    """62-sheet medical/healthcare project — more MEP-heavy."""
-    cursor = conn.execute(
-        """INSERT INTO projects (name, building_type, square_feet, stories, notes)
-           VALUES (?, ?, ?, ?, ?)""",
-        (
-            "Southpark Medical Center",
-            "healthcare",
-            120000,
-            3,
-            "3-story medical office building with outpatient surgery center. "
-            "Heavy MEP coordination. PM: Jake Reynolds. "
-            "McCrory Construction — Charlotte, NC.",
-        ),
-    )
-    pid = cursor.lastrowid
-    proj_dir = Path(PROJECTS_DIR) / str(pid)
-    proj_dir.mkdir(parents=True, exist_ok=True)
-
-    sheets = [
+    ],
+)
+
+
+# 62-sheet medical/healthcare project — more MEP-heavy.
+MEDICAL_CENTER = ProjectSpec(
+    name="Southpark Medical Center",
+    building_type="healthcare",
+    square_feet=120000,
+    stories=3,
+    notes=(
+        "3-story medical office building with outpatient surgery center. "
+        "Heavy MEP coordination. PM: Jake Reynolds. "
+        "McCrory Construction — Charlotte, NC."
+    ),
+    conf_range=(0.82, 0.98),
+    sheets=[
         ("G-001", "Cover Sheet & Index", "GEN", 1),
         ("G-002", "General Notes", "GEN", 2),
         ("G-003", "Code Analysis & Life Safety", "GEN", 3),
@@ -255,11 +259,8 @@ def _seed_medical_center(conn):
         ("T-201", "Server Room Layout", "TECH", 60),
         ("T-301", "AV Systems — OR & Conference", "TECH", 61),
         ("T-401", "Security Camera Layout", "TECH", 62),
-    ]
-
-    _insert_sheets(conn, pid, sheets, conf_range=(0.82, 0.98))
-
-    _insert_files(conn, pid, [
+    ],
+    files=[
         ("Southpark_Medical_Arch.pdf", "drawing", 12, "processed"),
         ("Southpark_Medical_Struct.pdf", "drawing", 6, "processed"),
         ("Southpark_Medical_Mech.pdf", "drawing", 9, "processed"),
@@ -269,32 +270,21 @@ def _seed_medical_center(conn):
         ("Southpark_Medical_Tech.pdf", "drawing", 5, "processed"),
         ("Southpark_Medical_Civil.pdf", "drawing", 3, "processed"),
         ("Southpark_Geotech_Report.pdf", "report", 45, "processed"),
-    ])
-
-    conn.execute(
-        """INSERT INTO processing_runs
-           (project_id, run_type, files_processed, sheets_found, status, notes)
-           VALUES (?, ?, ?, ?, ?, ?)""",
-        (pid, "ingestion", 9, 62, "complete",
+    ],
+    runs=[
+        ("ingestion", 9, 62, 0, "complete",
          "62-sheet medical office — 9 PDF packages including geotech report"),
-    )
-    conn.execute(
-        """INSERT INTO processing_runs
-           (project_id, run_type, files_processed, sheets_found, conflicts_found, status, notes)
-           VALUES (?, ?, ?, ?, ?, ?, ?)""",
-        (pid, "review", 9, 62, 18, "complete",
+        ("review", 9, 62, 18, "complete",
          "Heavy MEP coordination — 18 conflicts, mostly mechanical/plumbing clashes"),
-    )
-
-    _insert_feedback(conn, pid, [
+    ],
+    feedback=[
         ("CR-001", "confirm", "CRITICAL", "CRITICAL", "Beam vs ceiling in OR suite — must resolve before steel order"),
         ("CR-005", "confirm", "MAJOR", "MAJOR", "Duct clash with sprinkler main at Level 2 corridor"),
         ("CR-009", "downgrade", "MAJOR", "MINOR", "Medical gas routing workable with minor reroute"),
         ("CR-014", "confirm", "CRITICAL", "CRITICAL", "Emergency generator transfer sequence incomplete"),
         ("CR-019", "dismiss", "MINOR", "INFO", "Nurse call wiring path OK per low-voltage sub"),
-    ])
-
-    _insert_markups(conn, pid, [
+    ],
+    markups=[
         ("A-501", "callout", "RFI", "OR suite door width 3'-0\" — code requires 4'-0\" min for hospital gurney access", "Jake Reynolds", "#ff0000", 14),
         ("A-502", "cloud", "VERIFY", "MRI room shielding wall shown 6\" — confirm RF shielding spec with equipment vendor", "Jake Reynolds", "#ff6600", 15),
         ("M-401", "callout", "CODE", "Medical gas zone valve location not shown — required per NFPA 99 at each floor", "Jake Reynolds", "#ff0000", 30),
@@ -305,31 +295,23 @@ def _seed_medical_center(conn):
         ("P-301", "measurement", "DIM", "Medical gas riser size 1-1/4\" — verify capacity for 3 floors of O2/N2O/vacuum", "Jake Reynolds", "#0066ff", 38),
         ("FP-102", "callout", "CODE", "Clean agent suppression required in server room per NFPA 75 — not shown", "Jake Reynolds", "#ff0000", 51),
         ("FA-301", "callout", "RFI", "Nurse call head-end location not coordinated with IT server room layout on T-201", "Jake Reynolds", "#ff0000", 57),
-    ])
-
-    return pid
-
-
-def _seed_mixed_use(conn):
-    """38-sheet mixed-use retail/residential — smaller, tighter set."""
-    cursor = conn.execute(
-        """INSERT INTO projects (name, building_type, square_feet, stories, notes)
-           VALUES (?, ?, ?, ?, ?)""",
-        (
-            "Ballantyne Mixed-Use",
-            "mixed_use",
-            52000,
-            5,
-            "5-story mixed-use: ground-floor retail, 4 floors residential above. "
-            "Wood-frame over podium slab. PM: Sarah Chen. "
-            "McCrory Construction — Charlotte, NC.",
-        ),
-    )
-    pid = cursor.lastrowid
-    proj_dir = Path(PROJECTS_DIR) / str(pid)
-    proj_dir.mkdir(parents=True, exist_ok=True)
-
-    sheets = [
+    ],
+)
+
+
+# 38-sheet mixed-use retail/residential — smaller, tighter set.
+MIXED_USE = ProjectSpec(
+    name="Ballantyne Mixed-Use",
+    building_type="mixed_use",
+    square_feet=52000,
+    stories=5,
+    notes=(
+        "5-story mixed-use: ground-floor retail, 4 floors residential above. "
+        "Wood-frame over podium slab. PM: Sarah Chen. "
+        "McCrory Construction — Charlotte, NC."
+    ),
+    conf_range=(0.85, 0.97),
+    sheets=[
         ("G-001", "Cover Sheet & Index", "GEN", 1),
         ("C-101", "Site Plan", "CIV", 2),
         ("C-102", "Utility & Grading Plan", "CIV", 3),
@@ -368,85 +350,106 @@ def _seed_mixed_use(conn):
         ("A-801", "Amenity Deck Plan — Level 2", "ARCH", 36),
         ("A-901", "Parking Garage Plan", "ARCH", 37),
         ("E-501", "EV Charging Station Layout", "ELEC", 38),
-    ]
-
-    _insert_sheets(conn, pid, sheets, conf_range=(0.85, 0.97))
-
-    _insert_files(conn, pid, [
+    ],
+    files=[
         ("Ballantyne_MixedUse_Full_Set.pdf", "drawing", 38, "processed"),
         ("Ballantyne_Landscape.pdf", "drawing", 2, "processed"),
         ("Ballantyne_Soils_Report.pdf", "report", 28, "processed"),
-    ])
-
-    conn.execute(
-        """INSERT INTO processing_runs
-           (project_id, run_type, files_processed, sheets_found, status, notes)
-           VALUES (?, ?, ?, ?, ?, ?)""",
-        (pid, "ingestion", 3, 38, "complete",
+    ],
+    runs=[
+        ("ingestion", 3, 38, 0, "complete",
          "38-sheet mixed-use set — full drawing package + landscape + soils"),
-    )
-
-    _insert_feedback(conn, pid, [
+    ],
+    feedback=[
         ("CR-002", "confirm", "MAJOR", "MAJOR", "Podium slab penetrations not coordinated with plumbing"),
         ("CR-010", "downgrade", "MAJOR", "MINOR", "EV charging conduit path works — just needs sleeve in podium"),
-    ])
-
-    _insert_markups(conn, pid, [
+    ],
+    markups=[
         ("A-101", "callout", "RFI", "Retail storefront height 12' on elevation but 10' on plan — which is correct?", "Sarah Chen", "#ff0000", 4),
         ("S-101", "cloud", "VERIFY", "Podium slab pour-back at column C-3 — no rebar splice detail for wood-to-concrete", "Sarah Chen", "#ff6600", 13),
         ("M-101", "callout", "SPEC", "Retail HVAC shows split system but spec says VRF — confirm system type", "Sarah Chen", "#ff0000", 16),
         ("E-501", "callout", "CODE", "EV charging stations need dedicated 50A circuits — panel LP-R1 has no spare slots", "Sarah Chen", "#ff0000", 38),
         ("P-102", "callout", "CLASH", "Residential waste stack at unit B conflicts with shear wall on S-102", "Sarah Chen", "#ff0000", 21),
         ("A-801", "callout", "RFI", "Amenity deck waterproofing — no detail at planter drain penetration through slab", "Sarah Chen", "#ff6600", 36),
-    ])
+    ],
+)
+
+
+def _seed_project(conn, spec: ProjectSpec) -> int:
+    """Insert one project and all of its rows. Returns the project id."""
+    cursor = conn.execute(
+        """INSERT INTO projects (name, building_type, square_feet, stories, notes)
+           VALUES (?, ?, ?, ?, ?)""",
+        (spec.name, spec.building_type, spec.square_feet, spec.stories, spec.notes),
+    )
+    pid = cursor.lastrowid
+
+    _insert_sheets(conn, pid, spec.sheets, conf_range=spec.conf_range)
+    _insert_files(conn, pid, spec.files)
+    _insert_runs(conn, pid, spec.runs)
+    # Feedback history (makes the feedback/metrics page interesting)
+    _insert_feedback(conn, pid, spec.feedback)
+    _insert_markups(conn, pid, spec.markups)
 
     return pid
 
 
 def _insert_sheets(conn, pid, sheets, conf_range=(0.85, 0.99)):
     """Insert sheets with varied confidence scores."""
-    random.seed(42)  # Deterministic but varied
-    for sheet_id, sheet_name, discipline, page_num in sheets:
-        conf = round(random.uniform(*conf_range), 3)
-        conn.execute(
-            """INSERT INTO sheets
-               (project_id, page_number, sheet_id, sheet_name, discipline, confidence)
-               VALUES (?, ?, ?, ?, ?, ?)""",
-            (pid, page_num, sheet_id, sheet_name, discipline, conf),
-        )
+    # Deterministic but varied; a private generator leaves the global
+    # random state alone and yields the same values as random.seed(42)
+    uniform = random.Random(42).uniform
+    lo, hi = conf_range
+    rows = (
+        (pid, page_num, sheet_id, sheet_name, discipline, round(uniform(lo, hi), 3))
+        for sheet_id, sheet_name, discipline, page_num in sheets
+    )
+    conn.executemany(
+        """INSERT INTO sheets
+           (project_id, page_number, sheet_id, sheet_name, discipline, confidence)
+           VALUES (?, ?, ?, ?, ?, ?)""",
+        rows,
+    )
 
 
 def _insert_files(conn, pid, files):
     """Insert mock uploaded file records."""
-    for filename, file_type, page_count, status in files:
-        conn.execute(
-            """INSERT OR IGNORE INTO project_files
-               (project_id, filename, file_type, page_count, status)
-               VALUES (?, ?, ?, ?, ?)""",
-            (pid, filename, file_type, page_count, status),
-        )
+    conn.executemany(
+        """INSERT OR IGNORE INTO project_files
+           (project_id, filename, file_type, page_count, status)
+           VALUES (?, ?, ?, ?, ?)""",
+        ((pid, *file) for file in files),
+    )
+
+
+def _insert_runs(conn, pid, runs):
+    """Insert processing run records (ingestion runs pass 0 conflicts)."""
+    conn.executemany(
+        """INSERT INTO processing_runs
+           (project_id, run_type, files_processed, sheets_found, conflicts_found, status, notes)
+           VALUES (?, ?, ?, ?, ?, ?, ?)""",
+        ((pid, *run) for run in runs),
+    )
 
 
 def _insert_feedback(conn, pid, feedback_items):
     """Insert feedback history records."""
-    for conflict_id, action, orig_sev, adj_sev, note in feedback_items:
-        conn.execute(
-            """INSERT INTO feedback
-               (project_id, conflict_id, action, original_severity, adjusted_severity, user_note)
-               VALUES (?, ?, ?, ?, ?, ?)""",
-            (pid, conflict_id, action, orig_sev, adj_sev, note),
-        )
+    conn.executemany(
+        """INSERT INTO feedback
+           (project_id, conflict_id, action, original_severity, adjusted_severity, user_note)
+           VALUES (?, ?, ?, ?, ?, ?)""",
+        ((pid, *item) for item in feedback_items),
+    )
 
 
 def _insert_markups(conn, pid, markups):
     """Insert mock Bluebeam markup records."""
-    for sheet_id, markup_type, label, content, author, color, page in markups:
-        conn.execute(
-            """INSERT INTO markups
-               (project_id, sheet_id, markup_type, label, content, author, color, page_number)
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
-            (pid, sheet_id, markup_type, label, content, author, color, page),
-        )
+    conn.executemany(
+        """INSERT INTO markups
+           (project_id, sheet_id, markup_type, label, content, author, color, page_number)
+           VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+        ((pid, *markup) for markup in markups),
+    )
 
 
 if __name__ == "__main__":
@@ -347,6 +347,40 @@ def test_text_parser_code_refs():
     print(f"  Code refs: {codes}")
 
 
+def test_text_parser_re2_parity():
+    """RE2 twins tokenize ASCII sheet text exactly like re (when google-re2 is installed)."""
+    import re
+    from classification import text_parser
+
+    # A VERBOSE pattern with layout whitespace or a comment would diverge under RE2
+    for bad in (re.compile(r"ROOM \d+", re.VERBOSE), re.compile(r"RM\d+  # room", re.VERBOSE),
+                re.compile(r"RM.\d+", re.DOTALL)):
+        try:
+            text_parser._check_re2_safe(bad)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f"Expected {bad.pattern!r} to be rejected")
+
+    if not text_parser._RE2_TWINS:
+        print("  google-re2 not installed — engine comparison skipped")
+        return
+
+    texts = [ARCH_FLOOR_PLAN_TEXT, STRUCTURAL_PLAN_TEXT, MECHANICAL_PLAN_TEXT,
+             ELECTRICAL_PLAN_TEXT, PLUMBING_PLAN_TEXT, FIRE_PROTECTION_TEXT]
+    twins = text_parser._RE2_TWINS
+    for text in texts:
+        assert text.isascii()
+        with_re2 = parse_sheet_text(text)
+        text_parser._RE2_TWINS = {}
+        try:
+            with_re = parse_sheet_text(text)
+        finally:
+            text_parser._RE2_TWINS = twins
+        assert with_re2 == with_re, "RE2 and re tokens differ"
+    print(f"  RE2 matches re on {len(texts)} sheets")
+
+
 def test_sheet_classifier_prefix():
     """Classify sheets by prefix — commercial disciplines."""
     pages = [
@@ -447,6 +481,7 @@ if __name__ == "__main__":
         test_text_parser_doors,
         test_text_parser_callouts,
         test_text_parser_code_refs,
+        test_text_parser_re2_parity,
         test_sheet_classifier_prefix,
         test_entity_extractor_full,
         test_cross_reference_index,
@@ -5,6 +5,7 @@ Uses synthetic commercial construction data.
 Tests the full pipeline: entities -> xref map -> conflict rules -> RFI generation.
 """
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -29,8 +30,13 @@ from tests.test_classification import (
 )
 
 
+@lru_cache(maxsize=1)
 def _build_test_set():
-    """Build a complete test drawing set through the full pipeline."""
+    """
+    Build a complete test drawing set through the full pipeline.
+
+    Built once per session; the tests only read the entities.
+    """
     pages = [
         _make_page(ARCH_FLOOR_PLAN_TEXT, 1),
         _make_page(STRUCTURAL_PLAN_TEXT, 2),
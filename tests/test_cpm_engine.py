@@ -10,8 +10,10 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 from datetime import datetime
-from scheduling.activity_builder import build_activities
-from scheduling.cpm_engine import compute_cpm, get_critical_path, activities_to_export
+from scheduling.activity_builder import (
+    build_activities, build_activities_columns, get_edges, VALID_SCOPES, _CODE_FLAGS, _RATE_MAP,
+)
+from scheduling.cpm_engine import compute_cpm, compute_cpm_arrays, get_critical_path, activities_to_export
 from scheduling.predecessor_logic import validate_predecessors, detect_cycles
 from scheduling.wbs_builder import build_wbs, wbs_to_text
 from scheduling.schedule_export import generate_schedule
@@ -57,6 +59,39 @@ def test_activity_builder():
     print(f"  Warehouse 100K/1-story: {len(warehouse)} activities")
 
 
+def test_activity_links_not_shared():
+    """Editing one build's predecessor links doesn't leak into later builds."""
+    first = build_activities("office", 50000, 2)
+    linked = next(a for a in first if a.predecessors)
+    linked.predecessors[0]["lag"] = 99
+    linked.predecessors[0]["rel_type"] = "SS"
+
+    fresh = next(a for a in build_activities("office", 50000, 2) if a.activity_id == linked.activity_id)
+    assert fresh.predecessors[0]["lag"] == 0
+    assert fresh.predecessors[0]["rel_type"] == "FS"
+
+
+def test_ti_duration_scaling():
+    """Tenant-improvement builds scale rate durations to round(dur * 0.80)."""
+    checked = 0
+    for building_type in ("office", "retail", "warehouse", "medical"):
+        for square_feet in (5000, 25000, 50000, 120000, 400000):
+            for act in build_activities(building_type, square_feet, 1, scope="tenant_improvement"):
+                rate_code = _RATE_MAP.get(act.activity_id)
+                # Milestones and reno-specific overrides don't use the TI factor
+                if not rate_code or _CODE_FLAGS.get(act.activity_id, 0):
+                    continue
+                base = get_duration(rate_code, building_type, square_feet)
+                expected = max(2, round(base * 0.80)) if base > 2 else base
+                assert act.duration == expected, (
+                    f"{act.activity_id} {building_type} {square_feet} SF: "
+                    f"{act.duration} != {expected}"
+                )
+                checked += 1
+    assert checked > 0
+    print(f"  TI durations checked: {checked}")
+
+
 def test_predecessor_validation():
     """Predecessor validation catches errors."""
     activities = build_activities("office", 50000, 2)
@@ -92,6 +127,31 @@ def test_cpm_forward_backward():
     print(f"  All float values non-negative")
 
 
+def test_cpm_arrays_match_objects():
+    """NumPy CPM on columnar templates matches compute_cpm for every scope."""
+    for scope in VALID_SCOPES:
+        for building_type, square_feet, stories in (("office", 50000, 2), ("warehouse", 120000, 1)):
+            columns, _ = build_activities_columns(building_type, square_feet, stories, scope)
+            es, ef, ls, lf, tf = compute_cpm_arrays(columns["duration"], get_edges(scope))
+
+            activities = compute_cpm(build_activities(building_type, square_feet, stories, scope))
+            expected = [
+                (a.early_start, a.early_finish, a.late_start, a.late_finish, a.total_float)
+                for a in activities
+            ]
+            got = list(zip(es.tolist(), ef.tolist(), ls.tolist(), lf.tolist(), tf.tolist()))
+            assert got == expected, f"{scope} {building_type}: array CPM differs from compute_cpm"
+        print(f"  {scope}: {len(expected)} activities match")
+
+    # Two activities linked both ways
+    try:
+        compute_cpm_arrays([3, 4], [(0, 1, 0, 0), (1, 0, 0, 0)])
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("Expected ValueError for cyclic links")
+
+
 def test_critical_path():
     """Critical path identified correctly."""
     activities = build_activities("office", 50000, 2)
@@ -174,8 +234,11 @@ if __name__ == "__main__":
     tests = [
         test_production_rates,
         test_activity_builder,
+        test_activity_links_not_shared,
+        test_ti_duration_scaling,
         test_predecessor_validation,
         test_cpm_forward_backward,
+        test_cpm_arrays_match_objects,
         test_critical_path,
         test_wbs_structure,
         test_schedule_export,
@@ -0,0 +1,162 @@
+"""
+Learning tests — feedback store queries and the feedback API.
+
+Runs against a throwaway SQLite database, never the project DB.
+
+Run: python tests/test_feedback_store.py
+"""
+import sys
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import utils.db as db
+from learning.feedback_store import (
+    get_action_counts, get_feedback, get_severity_change_counts, record_feedback_bulk,
+)
+
+
+@contextmanager
+def _temp_db():
+    """Point utils.db at an empty SQLite file for the duration of a test."""
+    saved_path = db.DB_PATH
+    saved_conn = getattr(db._local, "sqlite_conn", None)
+    with tempfile.TemporaryDirectory() as tmp:
+        db.DB_PATH = Path(tmp) / "feedback_test.db"
+        db._local.sqlite_conn = None
+        try:
+            yield
+        finally:
+            conn = getattr(db._local, "sqlite_conn", None)
+            if conn is not None:
+                conn.close()
+            db.DB_PATH = saved_path
+            db._local.sqlite_conn = saved_conn
+
+
+def _new_project() -> int:
+    with db.pooled_conn() as conn:
+        cursor = conn.execute("INSERT INTO projects (name) VALUES (?)", ("Feedback Test",))
+        conn.commit()
+        return cursor.lastrowid
+
+
+def test_bulk_feedback():
+    """Bulk insert writes one row per entry and returns the count."""
+    with _temp_db():
+        pid = _new_project()
+        entries = [
+            {"conflict_id": "C-0001", "action": "accepted"},
+            {"conflict_id": "C-0002", "action": "false_positive", "user_note": "Not a clash"},
+            {"conflict_id": "C-0003", "action": "severity_change",
+             "original_severity": "MAJOR", "adjusted_severity": "MINOR"},
+            {"conflict_id": "C-0004"},
+        ]
+        assert record_feedback_bulk(pid, entries) == 4
+        assert record_feedback_bulk(pid, []) == 0
+
+        rows = get_feedback(pid)
+        assert len(rows) == 4
+        assert sorted(r["conflict_id"] for r in rows) == ["C-0001", "C-0002", "C-0003", "C-0004"]
+        assert {r["action"] for r in rows if r["conflict_id"] == "C-0004"} == {"note"}
+        print(f"  Bulk insert: {len(rows)} rows")
+
+
+def test_action_counts():
+    """Per-action counts and total come from one aggregate query."""
+    with _temp_db():
+        pid = _new_project()
+        other = _new_project()
+        actions = ["accepted"] * 3 + ["false_positive"] * 2 + ["severity_change", "note"]
+        record_feedback_bulk(pid, [{"conflict_id": f"C-{i:04d}", "action": a} for i, a in enumerate(actions)])
+        record_feedback_bulk(other, [{"conflict_id": "C-9999", "action": "accepted"}])
+
+        counts = get_action_counts(pid)
+        assert counts == {
+            "accepted": 3, "false_positive": 2, "severity_change": 1, "note": 1, "total": 7,
+        }, counts
+        assert get_action_counts(other + 1) == {
+            "accepted": 0, "false_positive": 0, "severity_change": 0, "note": 0, "total": 0,
+        }
+        print(f"  Action counts: {counts}")
+
+
+def test_severity_change_counts():
+    """Severity changes group on the conflict ID prefix before the first "-"."""
+    with _temp_db():
+        pid = _new_project()
+
+        def changes(conflict_id, severity, n):
+            return [{"conflict_id": conflict_id, "action": "severity_change",
+                     "adjusted_severity": severity}] * n
+
+        record_feedback_bulk(pid, (
+            changes("CR001-A-101", "MINOR", 3)
+            + changes("CR001-M-201", "MAJOR", 4)
+            + changes("CR002", "INFO", 3)            # no "-": whole ID is the key
+            + changes("CR003-E-101", "MINOR", 2)     # below SEVERITY_OVERRIDE_MIN
+            + changes("", "MINOR", 5)                # no conflict ID: ignored
+        ))
+
+        counts = get_severity_change_counts(pid)
+        assert counts == [
+            ("CR001", "MAJOR", 4),
+            ("CR001", "MINOR", 3),
+            ("CR002", "INFO", 3),
+        ], counts
+        print(f"  Severity changes: {counts}")
+
+
+def test_feedback_api_rejects_bad_entries():
+    """The feedback endpoint answers 400 for entries that aren't a list of objects."""
+    from flask import Flask
+    from web.api import api_bp
+
+    app = Flask(__name__)
+    app.register_blueprint(api_bp)
+    client = app.test_client()
+
+    for body in ({"entries": "C-0001"}, {"entries": {"conflict_id": "C-0001"}},
+                 {"entries": [{"conflict_id": "C-0001"}, "C-0002"]}, ["C-0001"]):
+        resp = client.post("/api/projects/1/feedback", json=body)
+        assert resp.status_code == 400, (body, resp.status_code)
+        assert "error" in resp.get_json()
+    print("  Malformed entries rejected with 400")
+
+
+# ── Run all tests ──────────────────────────────────────────
+
+if __name__ == "__main__":
+    tests = [
+        test_bulk_feedback,
+        test_action_counts,
+        test_severity_change_counts,
+        test_feedback_api_rejects_bad_entries,
+    ]
+
+    print(f"\n{'='*60}")
+    print(f"  DABO Learning Tests - {len(tests)} tests")
+    print(f"{'='*60}\n")
+
+    passed = 0
+    failed = 0
+    for test in tests:
+        name = test.__name__
+        try:
+            print(f"[RUN]  {name}")
+            test()
+            print(f"[PASS] {name}\n")
+            passed += 1
+        except Exception as e:
+            print(f"[FAIL] {name}: {e}\n")
+            import traceback
+            traceback.print_exc()
+            failed += 1
+
+    print(f"{'='*60}")
+    print(f"  Results: {passed} passed, {failed} failed, {len(tests)} total")
+    print(f"{'='*60}\n")
+
+    sys.exit(1 if failed else 0)
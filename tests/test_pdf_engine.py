@@ -110,6 +110,29 @@ def test_pdf_engine_import():
     print("  pdf_engine functions imported")
 
 
+def test_image_xrefs_same_size():
+    """Same-size images keep their own xrefs instead of an ambiguous 0."""
+    import fitz
+    from ingestion.pdf_engine import _extract_image_info
+
+    def png(rgb):
+        pix = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 8, 6), False)
+        pix.set_rect(pix.irect, rgb)
+        return pix.tobytes("png")
+
+    doc = fitz.open()
+    page = doc.new_page()
+    red = page.insert_image(fitz.Rect(10, 10, 90, 70), stream=png((255, 0, 0)))
+    blue = page.insert_image(fitz.Rect(100, 10, 180, 70), stream=png((0, 0, 255)))
+    page.insert_image(fitz.Rect(10, 100, 90, 160), xref=red)
+
+    images = _extract_image_info(page)
+    doc.close()
+    assert [img["xref"] for img in images] == [red, blue, red], images
+    assert all((img["width"], img["height"]) == (8, 6) for img in images)
+    print(f"  xrefs: {[img['xref'] for img in images]}")
+
+
 def test_file_router_import():
     """File router imports and functions are callable."""
     from ingestion.file_router import route_file, route_files
@@ -153,6 +176,7 @@ if __name__ == "__main__":
         test_helpers,
         test_database,
         test_pdf_engine_import,
+        test_image_xrefs_same_size,
         test_file_router_import,
         test_bluebeam_import,
         test_spec_reader_import,
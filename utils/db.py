@@ -13,6 +13,8 @@ Usage:
 """
 import os
 import sqlite3
+import threading
+from contextlib import contextmanager
 from pathlib import Path
 
 from config.settings import DB_PATH
@@ -114,6 +116,9 @@ CREATE TABLE IF NOT EXISTS markups (
     y               REAL,
     created_at      TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP
 );
+
+CREATE INDEX IF NOT EXISTS idx_fb_proj_action ON feedback(project_id, action);
+CREATE INDEX IF NOT EXISTS idx_ra_type_proj ON rule_adjustments(adjustment_type, project_id, rule_id);
 """
 
 # ── SQLite schema (local dev fallback) ──────────────────────
@@ -207,6 +212,9 @@ CREATE TABLE IF NOT EXISTS markups (
     y               REAL,
     created_at      TEXT DEFAULT (datetime('now'))
 );
+
+CREATE INDEX IF NOT EXISTS idx_fb_proj_action ON feedback(project_id, action);
+CREATE INDEX IF NOT EXISTS idx_ra_type_proj ON rule_adjustments(adjustment_type, project_id, rule_id);
 """
 
 
@@ -315,6 +323,18 @@ class _PgConnWrapper:
         wrapper.execute(sql, params)
         return wrapper
 
+    def executemany(self, sql, seq_of_params):
+        # Same INSERT OR IGNORE → ON CONFLICT DO NOTHING rewrite as execute()
+        was_ignore = "INSERT OR IGNORE" in sql.upper()
+        sql = sql.replace("?", "%s")
+        sql = sql.replace("INSERT OR IGNORE", "INSERT")
+        sql = sql.replace("insert or ignore", "INSERT")
+        if was_ignore and "ON CONFLICT" not in sql.upper():
+            sql = sql.rstrip().rstrip(";") + " ON CONFLICT DO NOTHING"
+        cur = self._conn.cursor()
+        cur.executemany(sql, seq_of_params)
+        cur.close()
+
     def executescript(self, sql):
         cur = self._conn.cursor()
         cur.execute(sql)
@@ -324,6 +344,9 @@ class _PgConnWrapper:
     def commit(self):
         self._conn.commit()
 
+    def rollback(self):
+        self._conn.rollback()
+
     def close(self):
         self._conn.close()
 
@@ -356,7 +379,14 @@ def _get_sqlite_conn() -> sqlite3.Connection:
     DB_PATH.parent.mkdir(parents=True, exist_ok=True)
     conn = sqlite3.connect(str(DB_PATH))
     conn.row_factory = sqlite3.Row
+    # WAL lets readers proceed during feedback writes; NORMAL sync is
+    # durable under WAL except on power loss. Both besides journal_mode are
+    # per-connection settings, so apply them on every open.
     conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-65536")       # 64 MB page cache
+    conn.execute("PRAGMA mmap_size=268435456")     # 256 MB memory-mapped reads
     conn.execute("PRAGMA foreign_keys=ON")
     conn.executescript(_SQLITE_SCHEMA_SQL)
     _sqlite_migrate(conn)
@@ -377,6 +407,41 @@ def get_conn():
     return _get_sqlite_conn()
 
 
+_local = threading.local()
+
+
+@contextmanager
+def pooled_conn():
+    """
+    Yield a connection that stays open for reuse by the current thread.
+
+    SQLite connections are cached per thread, so the schema bootstrap and
+    pragmas run once instead of on every call. Uncommitted work is rolled
+    back on exit. Postgres gets a fresh connection, closed on exit.
+
+    Usage:
+        with pooled_conn() as conn:
+            conn.execute(...)
+            conn.commit()
+    """
+    if _use_postgres():
+        conn = _get_pg_conn()
+        try:
+            yield conn
+        finally:
+            conn.close()
+        return
+
+    conn = getattr(_local, "sqlite_conn", None)
+    if conn is None:
+        conn = _local.sqlite_conn = _get_sqlite_conn()
+    try:
+        yield conn
+    finally:
+        if conn.in_transaction:
+            conn.rollback()
+
+
 def init_db():
     """Bootstrap the database schema (called at startup)."""
     if _use_postgres():
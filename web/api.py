@@ -793,8 +793,20 @@ def generate_report(pid):
 @api_bp.route("/projects/<int:pid>/feedback", methods=["POST"])
 def record_feedback(pid):
     data = request.get_json() or {}
+    if not isinstance(data, dict):
+        return jsonify({"error": "Feedback must be a JSON object"}), 400
+
+    bulk = "entries" in data
+    entries = data.get("entries") or []
+    if bulk and not (isinstance(entries, list) and all(isinstance(e, dict) for e in entries)):
+        return jsonify({"error": "entries must be a list of objects"}), 400
 
     try:
+        if bulk:
+            from learning.feedback_store import record_feedback_bulk
+            count = record_feedback_bulk(pid, entries)
+            return jsonify({"count": count, "message": "Feedback recorded"})
+
         from learning.feedback_store import record_feedback as store_fb
         row_id = store_fb(
             project_id=pid,